@@ -3,12 +3,61 @@ Jewish calendrical date and times for a given location.
 
 HDate calculates and generates a representation either in English or Hebrew
 of the Jewish calendrical date and times for a given location
+
+Only the date conversion is imported eagerly. The other exports are imported on
+first access, so that converting dates doesn't pay for the holidays, the zmanim
+and the other databases.
 """
 
-from hdate.date_info import HDateInfo
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from hdate.cache import cache_clear, cache_info
 from hdate.hebrew_date import HebrewDate, Months
-from hdate.holidays import HolidayTypes
-from hdate.location import Location
-from hdate.zmanim import Zmanim
 
-__all__ = ["HDateInfo", "Zmanim", "HebrewDate", "Months", "Location", "HolidayTypes"]
+if TYPE_CHECKING:
+    from hdate.date_info import HDateInfo
+    from hdate.holidays import HolidayTypes
+    from hdate.location import Location
+    from hdate.zmanim import Zmanim
+
+__all__ = [
+    "HDateInfo",
+    "Zmanim",
+    "HebrewDate",
+    "Months",
+    "Location",
+    "HolidayTypes",
+    "cache_info",
+    "cache_clear",
+]
+
+_LAZY_EXPORTS = {
+    "HDateInfo": "hdate.date_info",
+    "HolidayTypes": "hdate.holidays",
+    "Location": "hdate.location",
+    "Zmanim": "hdate.zmanim",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the lazy exports and the submodules on first access."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name]), name)
+    else:
+        try:
+            value = import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,129 @@
+"""Bounded caches with hit/miss/eviction statistics.
+
+All the caches used by hdate are registered by name, so that their sizes can be
+configured and their statistics inspected in a single place.
+
+>>> from hdate.cache import BoundedCache
+>>> double = BoundedCache(lambda number: 2 * number, "double", maxsize=1)
+>>> double(1), double(2), double(2)
+(2, 4, 4)
+>>> double.cache_info()
+CacheInfo(hits=1, misses=2, evictions=1, maxsize=1, currsize=1)
+
+The registered caches are resized with `configure`, e.g.
+``configure(from_jdn=10_000)``. The caches are registered when their module is
+imported; the sizes of the caches which aren't registered yet are kept until they are.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache, update_wrapper
+from typing import Any, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Statistics of a single cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the ratio of calls answered from the cache."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class BoundedCache(Generic[T]):
+    """Least recently used cache of a function, with a configurable size."""
+
+    def __init__(self, func: Callable[..., T], name: str, maxsize: int | None):
+        self.name = name
+        self._func = func
+        self._cached = lru_cache(maxsize)(func)
+        self._failures = 0
+        update_wrapper(self, func)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> T:
+        try:
+            return self._cached(*args, **kwargs)
+        except BaseException:
+            # Counted as a miss, but nothing was added to the cache
+            self._failures += 1
+            raise
+
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of the cache since it was last cleared."""
+        info = self._cached.cache_info()
+        # Every successful miss adds an entry, which stays until it's evicted or cleared
+        return CacheInfo(
+            hits=info.hits,
+            misses=info.misses,
+            evictions=info.misses - self._failures - info.currsize,
+            maxsize=info.maxsize,
+            currsize=info.currsize,
+        )
+
+    def cache_clear(self) -> None:
+        """Empty the cache and reset its statistics."""
+        self._cached.cache_clear()
+        self._failures = 0
+
+    def resize(self, maxsize: int | None) -> None:
+        """Set the maximal number of entries (None is unbounded), clears the cache."""
+        self._cached = lru_cache(maxsize)(self._func)
+        self._failures = 0
+
+
+_CACHES: dict[str, BoundedCache[Any]] = {}
+# The sizes configured before the cache was registered
+_PENDING_SIZES: dict[str, int | None] = {}
+
+
+def bounded_cache(
+    name: str, maxsize: int | None
+) -> Callable[[Callable[..., T]], BoundedCache[T]]:
+    """Decorate a function with a registered, bounded cache."""
+
+    def decorator(func: Callable[..., T]) -> BoundedCache[T]:
+        if name in _CACHES:
+            raise ValueError(f"A cache named {name} is already registered")
+        size = _PENDING_SIZES.pop(name, maxsize)
+        _CACHES[name] = cached = BoundedCache(func, name, size)
+        return cached
+
+    return decorator
+
+
+def configure(**sizes: int | None) -> None:
+    """Set the maximal size of the named caches.
+
+    Caches which aren't registered yet (their module wasn't imported) get the size
+    when they are.
+    """
+    for name, maxsize in sizes.items():
+        if name in _CACHES:
+            _CACHES[name].resize(maxsize)
+        else:
+            _PENDING_SIZES[name] = maxsize
+
+
+def cache_info() -> dict[str, CacheInfo]:
+    """Return the statistics of all the registered caches.
+
+    The caches of the modules which weren't imported yet aren't listed.
+    """
+    return {name: cached.cache_info() for name, cached in _CACHES.items()}
+
+
+def cache_clear() -> None:
+    """Empty all the caches."""
+    for cached in _CACHES.values():
+        cached.cache_clear()
@@ -1,8 +1,22 @@
 """Methods for going back and forth between Gregorian date and Julian day."""
 
+# The batch conversions need the year layouts from hdate.hebrew_date, imported lazily
+# pylint: disable=cyclic-import
+
+from __future__ import annotations
+
 import datetime as dt
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from hdate.hebrew_date import YearLayout
 
 JDN_OFFSET = 1_721_425
+UNIX_EPOCH_ORDINAL = 719_163  # dt.date(1970, 1, 1).toordinal()
+MAX_ORDINAL = 3_652_059  # dt.date.max.toordinal()
 
 
 def gdate_to_jdn(date_obj: dt.date | dt.datetime) -> int:
@@ -13,3 +27,167 @@ def gdate_to_jdn(date_obj: dt.date | dt.datetime) -> int:
 def jdn_to_gdate(jdn: int) -> dt.date:
     """Convert JDN to Gregorian date using stdlib."""
     return dt.date.fromordinal(jdn - JDN_OFFSET)
+
+
+def gdates_to_hebrew(
+    dates: npt.ArrayLike,
+) -> tuple[npt.NDArray[np.int32], npt.NDArray[np.int8], npt.NDArray[np.int8]]:
+    """Convert an array of Gregorian dates to Hebrew years, months and days.
+
+    The dates are either proleptic Gregorian ordinals (as returned by
+    `datetime.date.toordinal`) or `datetime64` values. The months are returned as the
+    values of the `Months` enum. Requires numpy (`pip install hdate[numpy]`). Raises a
+    ValueError for NaT and for dates outside the range of `datetime.date`.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+
+    from hdate import hebrew_date
+
+    jdns = _to_ordinals(dates) + JDN_OFFSET
+    if jdns.size == 0:
+        return (
+            np.zeros(jdns.shape, dtype=np.int32),
+            np.zeros(jdns.shape, dtype=np.int8),
+            np.zeros(jdns.shape, dtype=np.int8),
+        )
+
+    # Estimate the range of years and look up when each of them starts
+    estimate = (
+        (jdns - hebrew_date.HEBREW_EPOCH_JDN)
+        * hebrew_date.MEAN_YEAR_DENOMINATOR
+        // hebrew_date.MEAN_YEAR_NUMERATOR
+    )
+    years = np.arange(int(estimate.min()), int(estimate.max()) + 3)
+    layouts = [hebrew_date.year_layout(int(year)) for year in years]
+    rosh_hashana = np.array([layout.rosh_hashana for layout in layouts])
+    index = np.searchsorted(rosh_hashana, jdns, side="right") - 1
+    if (index < 0).any():
+        raise ValueError(
+            f"Can't find the Hebrew year of {jdns[index < 0][0] - JDN_OFFSET}"
+        )
+    day_of_year = jdns - rosh_hashana[index]
+
+    kinds, month_table, day_table = _day_of_year_tables(layouts)
+    return (
+        years[index].astype(np.int32),
+        month_table[kinds[index], day_of_year],
+        day_table[kinds[index], day_of_year],
+    )
+
+
+def _to_ordinals(dates: npt.ArrayLike) -> npt.NDArray[np.int64]:
+    """Return the Gregorian ordinals of the dates, raise a ValueError if illegal."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    values = np.asarray(dates)
+    if np.issubdtype(values.dtype, np.datetime64):
+        if np.isnat(values).any():
+            raise ValueError("Can't convert NaT to a Hebrew date")
+        values = values.astype("datetime64[D]").astype(np.int64) + UNIX_EPOCH_ORDINAL
+    ordinals: npt.NDArray[np.int64] = values.astype(np.int64)
+    if (illegal := (ordinals < 1) | (ordinals > MAX_ORDINAL)).any():
+        raise ValueError(
+            f"Ordinal {ordinals[illegal][0]} is illegal: legal values are "
+            f"1-{MAX_ORDINAL}"
+        )
+    return ordinals
+
+
+def _day_of_year_tables(
+    layouts: list[YearLayout],
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.int8], npt.NDArray[np.int8]]:
+    """Return day of year -> month and day of year -> day of month tables.
+
+    The months of a year only depend on its length, so a single row is built for each
+    of the (at most 6) year lengths. The first array maps each layout to its row.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    lengths, kinds = np.unique(
+        [layout.length for layout in layouts], return_inverse=True
+    )
+    month_table = np.zeros((len(lengths), 385), dtype=np.int8)
+    day_table = np.zeros((len(lengths), 385), dtype=np.int8)
+    for kind, length in enumerate(lengths):
+        layout = layouts[int(np.argmax(kinds == kind))]
+        ends = (*layout.starts[1:], int(length))
+        for month, start, end in zip(layout.months, layout.starts, ends):
+            month_table[kind, start:end] = month
+            day_table[kind, start:end] = np.arange(1, end - start + 1)
+    return kinds, month_table, day_table
+
+
+def hebrew_to_gdates(
+    years: npt.ArrayLike, months: npt.ArrayLike, days: npt.ArrayLike
+) -> npt.NDArray[np.int64]:
+    """Convert arrays of Hebrew years, months and days to Gregorian ordinals.
+
+    The result can be turned into `datetime64` values by subtracting
+    `UNIX_EPOCH_ORDINAL` and casting to `datetime64[D]`. Requires numpy
+    (`pip install hdate[numpy]`). Raises a ValueError for dates which don't exist.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+
+    from hdate.hebrew_date import year_layout
+
+    _years, _months, _days = np.broadcast_arrays(years, months, days)
+    if _years.size == 0:
+        return np.zeros(_years.shape, dtype=np.int64)
+    unique_years, index = np.unique(_years, return_inverse=True)
+    layouts = [year_layout(int(year)) for year in unique_years]
+    rosh_hashana = np.array([layout.rosh_hashana for layout in layouts])
+    offsets = np.array([layout.offsets for layout in layouts])
+    index = index.reshape(_years.shape)
+
+    _check_dates(layouts, index, _years, _months, _days)
+    jdns: npt.NDArray[np.int64] = (
+        rosh_hashana[index] + offsets[index, _months.astype(np.intp)] + _days - 1
+    ).astype(np.int64)
+    return jdns - JDN_OFFSET
+
+
+def _check_dates(
+    layouts: list[YearLayout],
+    index: npt.NDArray[np.intp],
+    years: npt.NDArray[np.int64],
+    months: npt.NDArray[np.int64],
+    days: npt.NDArray[np.int64],
+) -> None:
+    """Raise a ValueError if any of the dates doesn't exist.
+
+    `index` maps each date to the layout of its year.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+
+    from hdate.hebrew_date import Months
+
+    if (out_of_range := (months < 1) | (months > len(Months))).any():
+        raise ValueError(f"Month {months[out_of_range][0]} is illegal")
+    max_days = _month_lengths(layouts)[index, months.astype(np.intp)]
+    if (missing := max_days == 0).any():
+        raise ValueError(
+            f"Month {months[missing][0]} is not a valid month for year "
+            f"{years[missing][0]}"
+        )
+    if (illegal := (days < 1) | (days > max_days)).any():
+        raise ValueError(
+            f"Day {days[illegal][0]} is illegal: legal values are "
+            f"1-{max_days[illegal][0]} for month {months[illegal][0]}"
+        )
+
+
+def _month_lengths(layouts: list[YearLayout]) -> npt.NDArray[np.int64]:
+    """Return the length of each month of each year, 0 for months not in the year."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    from hdate.hebrew_date import Months  # pylint: disable=import-outside-toplevel
+
+    lengths = np.zeros((len(layouts), len(Months) + 1), dtype=np.int64)
+    for row, layout in enumerate(layouts):
+        ends = (*layout.starts[1:], layout.length)
+        for month, start, end in zip(layout.months, layout.starts, ends):
+            lengths[row, month] = end - start
+    return lengths
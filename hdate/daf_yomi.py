@@ -1,11 +1,18 @@
-"""Daf Yomi module."""
+"""Daf Yomi module, and the other cyclic learning schedules."""
+
+from __future__ import annotations
 
 import datetime as dt
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from typing import ClassVar
+from itertools import accumulate
+from typing import ClassVar, Iterator, cast
 
 from hdate.gematria import hebrew_number
-from hdate.translator import TranslatorMixin
+from hdate.hebrew_date import HebrewDate
+from hdate.holidays import HolidayDatabase
+from hdate.translator import Language, TranslatorMixin
 
 
 @dataclass(frozen=True)
@@ -15,45 +22,231 @@ class Masechta(TranslatorMixin):
     name: str
     pages: int
 
-    def __str__(self) -> str:
-        name = self.get_translation(self.name)
-        daf = hebrew_number(self.pages, short=True)
+    def format(self, language: Language | None = None) -> str:
+        name = self.get_translation(self.name, language)
+        daf = hebrew_number(self.pages, short=True, language=language)
         return f"{name} {daf}"
 
 
+@dataclass(frozen=True)
+class CycleCalendar:
+    """The daf learnt on each day of a cycle, stored as compact arrays."""
+
+    start: dt.date
+    masechtot: tuple[Masechta, ...]
+    # For each learning day: the index in `masechtot`, the daf and the days since
+    # the start of the cycle
+    indexes: array[int]
+    dafim: array[int]
+    days: array[int]
+
+    def __len__(self) -> int:
+        return len(self.dafim)
+
+    def __getitem__(self, day: int) -> Masechta:
+        return Masechta(self.masechtot[self.indexes[day]].name, self.dafim[day])
+
+    def date(self, day: int) -> dt.date:
+        """Return the date of the given learning day of the cycle."""
+        return self.start + dt.timedelta(days=self.days[day])
+
+
 @dataclass
-class DafYomiDatabase:
-    """Database of Masechtos."""
+class LearningSchedule:
+    """A schedule learning the pages of a list of masechtot, one a day, in cycles.
 
-    # The first few cycles were only 2702 blatt. After that it became 2711. Even with
-    # that, the math doesn't play nicely with the dates before the 11th cycle :(
-    # From cycle 11 onwards, it was simple and sequential
-    _start_date: ClassVar[dt.date] = dt.date(1997, 9, 29)
+    Only one daf (page) of a masechta is learnt each day, so schedules learning several
+    units a day or units other than dafim (e.g. Mishna Yomit, Rambam) aren't supported.
+    Schedules may skip the days of some holidays, on which nothing is learnt.
+    """
+
+    _start_date: ClassVar[dt.date]
+    _start_cycle: ClassVar[int] = 1
+    _first_daf: ClassVar[int] = 1
+    _skipped_holidays: ClassVar[tuple[str, ...]] = ()
     _masechtot: ClassVar[list[Masechta]]
+    # The number of pages before each masechta, then the length of the cycle
+    _offsets: ClassVar[list[int]]
+    _by_name: ClassVar[dict[str, int]]
+    # The Hebrew year up to which (excluding) the skipped dates are computed, and the
+    # sorted dates. Replaced as a whole, so that they are always read consistently
+    _skipped_dates: ClassVar[tuple[int, list[dt.date]]]
 
     @classmethod
     def register(cls, masechtot: list[Masechta]) -> None:
         """Regisetr a list of masechtos."""
         cls._masechtot = masechtot
+        cls._offsets = list(accumulate(masechta.pages for masechta in masechtot))
+        cls._offsets.insert(0, 0)
+        cls._by_name = {masechta.name: i for i, masechta in enumerate(masechtot)}
+        cls._skipped_dates = (HebrewDate.from_gdate(cls._start_date).year, [])
 
     @classmethod
     def cycle_length(cls) -> int:
-        """Return the length of a full cycle."""
-        return sum(masechta.pages for masechta in cls._masechtot)
+        """Return the number of learning days in a full cycle."""
+        return cls._offsets[-1]
 
-    def lookup(self, date: dt.date) -> Masechta:
-        """Return the start date of a full cycle."""
-        days_since_start = (date - self._start_date).days
-        page_number = days_since_start % self.cycle_length()
+    def lookup(self, date: dt.date) -> Masechta | None:
+        """Return the daf learnt on the given date, None on a skipped day."""
+        if self._is_skipped(date):
+            return None
+        page_number = self._learning_day(date) % self.cycle_length()
+        masechta_index = bisect_right(self._offsets, page_number) - 1
+        return Masechta(
+            self._masechtot[masechta_index].name,
+            page_number - self._offsets[masechta_index] + self._first_daf,
+        )
+
+    def lookup_range(
+        self, start: dt.date, end: dt.date
+    ) -> Iterator[tuple[dt.date, Masechta]]:
+        """Yield the daf learnt on each day from `start` until `end` (exclusive).
+
+        Skipped days are left out.
+        """
+        skipped = self._skipped_between(start, end)
+        page_number = self._learning_day(start) % self.cycle_length()
+        masechta_index = bisect_right(self._offsets, page_number) - 1
+        for days in range((end - start).days):
+            date = start + dt.timedelta(days=days)
+            if date in skipped:
+                continue
+            masechta = self._masechtot[masechta_index]
+            daf = page_number - self._offsets[masechta_index] + self._first_daf
+            yield date, Masechta(masechta.name, daf)
+            page_number += 1
+            if page_number == self._offsets[masechta_index + 1]:
+                masechta_index += 1
+                if page_number == self.cycle_length():
+                    page_number = masechta_index = 0
+
+    def cycle_start(self, cycle: int) -> dt.date:
+        """Return the start date of the given cycle."""
+        return self._date_of_learning_day(self._cycle_offset(cycle))
+
+    def date_of(self, masechta: str, daf: int, cycle: int | None = None) -> dt.date:
+        """Return the date the daf is learnt, in the given cycle.
+
+        Without a cycle, the first date from today on is returned.
+        """
+        if (index := self._by_name.get(masechta)) is None:
+            raise ValueError(f"Unknown masechta: {masechta}")
+        last_daf = self._masechtot[index].pages + self._first_daf - 1
+        if not self._first_daf <= daf <= last_daf:
+            raise ValueError(f"Daf {daf} is not in {masechta}")
+        page_number = self._offsets[index] + daf - self._first_daf
+        if cycle is not None:
+            return self._date_of_learning_day(self._cycle_offset(cycle) + page_number)
+        today = self._learning_day(dt.date.today())
+        learning_day = today - today % self.cycle_length() + page_number
+        if learning_day < today:
+            learning_day += self.cycle_length()
+        return self._date_of_learning_day(learning_day)
+
+    def cycle_calendar(self, cycle: int) -> CycleCalendar:
+        """Return the daf learnt on each day of the given cycle."""
+        start = self.cycle_start(cycle)
+        end = self.cycle_start(cycle + 1)
+        indexes, dafim, days = array("B"), array("H"), array("H")
+        for index, masechta in enumerate(self._masechtot):
+            indexes.extend([index] * masechta.pages)
+            dafim.extend(range(self._first_daf, masechta.pages + self._first_daf))
+        skipped = self._skipped_between(start, end)
+        days.extend(
+            day
+            for day in range((end - start).days)
+            if start + dt.timedelta(days=day) not in skipped
+        )
+        return CycleCalendar(start, tuple(self._masechtot), indexes, dafim, days)
+
+    def _cycle_offset(self, cycle: int) -> int:
+        """Return the number of learning days from the start to the given cycle."""
+        if cycle < self._start_cycle:
+            raise ValueError(f"Cycles before {self._start_cycle} are not supported")
+        return (cycle - self._start_cycle) * self.cycle_length()
+
+    def _learning_day(self, date: dt.date) -> int:
+        """Return the number of learning days from the start to the given date."""
+        days = (date - self._start_date).days
+        if not self._skipped_holidays:
+            return days
+        if days < 0:
+            raise ValueError(f"The schedule starts on {self._start_date}")
+        return days - bisect_left(self._skipped(date), date)
 
-        masechta_index = 0
-        for masechta in self._masechtot:
-            if page_number < masechta.pages:
+    def _date_of_learning_day(self, learning_day: int) -> dt.date:
+        """Return the date of the n-th learning day since the start."""
+        date = self._start_date + dt.timedelta(days=learning_day)
+        while self._skipped_holidays:
+            # Push the date by the days skipped until it (included)
+            skipped = bisect_right(self._skipped(date), date)
+            shifted = self._start_date + dt.timedelta(days=learning_day + skipped)
+            if shifted == date:
                 break
-            page_number -= masechta.pages
-            masechta_index += 1
+            date = shifted
+        return date
 
-        return Masechta(self._masechtot[masechta_index].name, page_number + 2)
+    def _is_skipped(self, date: dt.date) -> bool:
+        if not self._skipped_holidays:
+            return False
+        dates = self._skipped(date)
+        index = bisect_left(dates, date)
+        return index < len(dates) and dates[index] == date
+
+    def _skipped_between(self, start: dt.date, end: dt.date) -> set[dt.date]:
+        if not self._skipped_holidays:
+            return set()
+        dates = self._skipped(end)
+        return set(dates[bisect_left(dates, start) : bisect_left(dates, end)])
+
+    @classmethod
+    def _skipped(cls, date: dt.date) -> list[dt.date]:
+        """Return the sorted skipped dates, computed at least up to the given date."""
+        year = HebrewDate.from_gdate(date).year + 1
+        computed_until, skipped = cls._skipped_dates
+        if year >= computed_until:
+            # Compute a few decades at once, to avoid recomputing for each year
+            until = max(year + 1, computed_until + 50)
+            holidays = HolidayDatabase(diaspora=False)
+            dates = {
+                holiday_date.to_gdate()
+                for name in cls._skipped_holidays
+                for holiday_date in holidays.occurrences(name, computed_until, until)
+            }
+            skipped = skipped + sorted(
+                holiday_date
+                for holiday_date in dates
+                if holiday_date >= cls._start_date
+            )
+            cls._skipped_dates = (until, skipped)
+        return skipped
+
+
+@dataclass
+class DafYomiDatabase(LearningSchedule):
+    """Database of Masechtos."""
+
+    # The first few cycles were only 2702 blatt. After that it became 2711. Even with
+    # that, the math doesn't play nicely with the dates before the 11th cycle :(
+    # From cycle 11 onwards, it was simple and sequential
+    _start_date: ClassVar[dt.date] = dt.date(1997, 9, 29)
+    _start_cycle: ClassVar[int] = 11
+    _first_daf: ClassVar[int] = 2
+
+    def lookup(self, date: dt.date) -> Masechta:
+        """Return the daf learnt on the given date."""
+        return cast(Masechta, super().lookup(date))
+
+
+@dataclass
+class YerushalmiYomiDatabase(LearningSchedule):
+    """Database of the Daf Yomi of the Jerusalem Talmud (Vilna edition).
+
+    No daf is learnt on Yom Kippur and on Tisha B'Av.
+    """
+
+    _start_date: ClassVar[dt.date] = dt.date(1980, 2, 2)
+    _skipped_holidays: ClassVar[tuple[str, ...]] = ("yom_kippur", "tisha_bav")
 
 
 DAF_YOMI_MESECHTOS = (
@@ -97,3 +290,47 @@ DAF_YOMI_MESECHTOS = (
 )
 
 DafYomiDatabase.register(list(DAF_YOMI_MESECHTOS))
+
+YERUSHALMI_YOMI_MESECHTOS = (
+    Masechta("berachos", 68),
+    Masechta("peah", 37),
+    Masechta("demai", 34),
+    Masechta("kilayim", 44),
+    Masechta("sheviis", 31),
+    Masechta("terumos", 59),
+    Masechta("maasros", 26),
+    Masechta("maaser_sheni", 33),
+    Masechta("challah", 28),
+    Masechta("orlah", 20),
+    Masechta("bikkurim", 13),
+    Masechta("shabbos", 92),
+    Masechta("eruvin", 65),
+    Masechta("pesachim", 71),
+    Masechta("beitzah", 22),
+    Masechta("rosh_hashanah", 22),
+    Masechta("yoma", 42),
+    Masechta("succah", 26),
+    Masechta("taanis", 26),
+    Masechta("shekalim", 33),
+    Masechta("megillah", 34),
+    Masechta("chagigah", 22),
+    Masechta("moed_katan", 19),
+    Masechta("yevamos", 85),
+    Masechta("kesubos", 72),
+    Masechta("sotah", 47),
+    Masechta("nedarim", 40),
+    Masechta("nazir", 47),
+    Masechta("gittin", 54),
+    Masechta("kiddushin", 48),
+    Masechta("bava_kamma", 44),
+    Masechta("bava_metzia", 37),
+    Masechta("bava_basra", 34),
+    Masechta("sanhedrin", 44),
+    Masechta("makkos", 9),
+    Masechta("shevuos", 57),
+    Masechta("avodah_zarah", 37),
+    Masechta("horayos", 19),
+    Masechta("niddah", 13),
+)
+
+YerushalmiYomiDatabase.register(list(YERUSHALMI_YOMI_MESECHTOS))
@@ -10,6 +10,7 @@ from __future__ import annotations
 import datetime as dt
 from dataclasses import dataclass, field
 from functools import cached_property
+from typing import ClassVar
 
 from hdate.daf_yomi import DafYomiDatabase
 from hdate.gematria import hebrew_number
@@ -18,11 +19,11 @@ from hdate.holidays import Holiday, HolidayDatabase, HolidayTypes
 from hdate.omer import Omer
 from hdate.parasha import ParashaDatabase
 from hdate.tekufot import Nusachim, Tekufot
-from hdate.translator import TranslatorMixin, get_language
+from hdate.translator import Language, TranslatorMixin, get_language
 
 
 @dataclass
-class HDateInfo(TranslatorMixin):  # pylint: disable=too-many-instance-attributes
+class HDateInfo(TranslatorMixin):  # pylint: disable=R0902,R0904
     """
     Hebrew date information class.
 
@@ -33,6 +34,8 @@ class HDateInfo(TranslatorMixin):  # pylint: disable=too-many-instance-attribute
     diaspora: bool = False
     nusach: Nusachim = "sephardi"
 
+    _daf_yomi: ClassVar[DafYomiDatabase] = DafYomiDatabase()
+
     def __post_init__(self) -> None:
         # Initialize private variables
         self._last_updated = ""
@@ -57,21 +60,28 @@ class HDateInfo(TranslatorMixin):  # pylint: disable=too-many-instance-attribute
         """
         return HolidayDatabase(self.diaspora)
 
-    def __str__(self) -> str:
-        language = get_language()
+    @cached_property
+    def _parashas(self) -> ParashaDatabase:
+        """Return the ParashaDatabase instance."""
+        return ParashaDatabase(self.diaspora)
+
+    def format(self, language: Language | None = None) -> str:
+        language = language or get_language()
         in_prefix = "ב" if language == "he" else ""
-        day_number = hebrew_number(self.hdate.day)
-        year_number = hebrew_number(self.hdate.year)
+        hdate = self.hdate
+        day_number = hebrew_number(hdate.day, language=language)
+        year_number = hebrew_number(hdate.year, language=language)
         result = (
-            f"{self.hdate.dow()} "
-            f"{day_number} {in_prefix}{self.hdate.month} {year_number}"
+            f"{hdate.dow().format(language)} "
+            f"{day_number} {in_prefix}{hdate.month.format(language)} {year_number}"
         )
 
         if self.omer.total_days > 0:
-            result = f"{result} {self.omer}"
+            result = f"{result} {self.omer.format(language)}"
 
-        if self.holidays:
-            result = f"{result} {', '.join(str(holiday) for holiday in self.holidays)}"
+        if holidays := self.holidays:
+            names = ", ".join(holiday.format(language) for holiday in holidays)
+            result = f"{result} {names}"
         return result
 
     @property
@@ -115,9 +125,7 @@ class HDateInfo(TranslatorMixin):  # pylint: disable=too-many-instance-attribute
     @property
     def parasha(self) -> str:
         """Return the upcoming parasha."""
-        db = ParashaDatabase(self.diaspora)
-        parasha = db.lookup(self.hdate)
-        return str(parasha)
+        return str(self._parashas.lookup(self.hdate))
 
     @property
     def holidays(self) -> list[Holiday]:
@@ -127,9 +135,7 @@ class HDateInfo(TranslatorMixin):  # pylint: disable=too-many-instance-attribute
     @property
     def daf_yomi(self) -> str:
         """Return the daf yomi for the given date."""
-        db = DafYomiDatabase()
-        daf = db.lookup(self.gdate)
-        return str(daf)
+        return str(self._daf_yomi.lookup(self.gdate))
 
     @property
     def gevurot_geshamim(self) -> str:
@@ -149,12 +155,12 @@ class HDateInfo(TranslatorMixin):  # pylint: disable=too-many-instance-attribute
     @property
     def is_holiday(self) -> bool:
         """Return True if this date is a holiday (any kind)."""
-        return len(self.holidays) > 0
+        return self._holidays.is_holiday(self.hdate)
 
     @property
     def is_yom_tov(self) -> bool:
         """Return True if this date is a Yom Tov."""
-        return any(holiday.type == HolidayTypes.YOM_TOV for holiday in self.holidays)
+        return self._holidays.is_holiday(self.hdate, HolidayTypes.YOM_TOV)
 
     @property
     def next_day(self) -> HDateInfo:
@@ -1,38 +1,73 @@
 """Gematria for hebrew numbers."""
 
-from hdate.translator import get_language
+from typing import Iterable
+
+from hdate.cache import bounded_cache
+from hdate.translator import Language, get_language
 
 DIGITS = (
     (" ", "א", "ב", "ג", "ד", "ה", "ו", "ז", "ח", "ט"),
     ("ט", "י", "כ", "ל", "מ", "נ", "ס", "ע", "פ", "צ"),
     (" ", "ק", "ר", "ש", "ת"),
 )
+MAX_NUMBER = 9999
+
+# The long and short forms of the numbers, filled as they are formatted
+_NUMERALS: tuple[dict[int, str], dict[int, str]] = ({}, {})
 
 
-def hebrew_number(num: int, short: bool = False) -> str:
-    """Return "Gimatria" number."""
-    if get_language() != "he":
+def hebrew_number(
+    num: int, short: bool = False, language: Language | None = None
+) -> str:
+    """Return "Gimatria" number (or the plain number, unless rendered in Hebrew)."""
+    if (language or get_language()) != "he":
         return str(num)
-    if not 0 <= num < 10000:
+    if (numeral := _NUMERALS[short].get(num)) is None:
+        numeral = _NUMERALS[short][num] = _hebrew_numeral(num, short)
+    return numeral
+
+
+def hebrew_numbers(
+    numbers: Iterable[int], short: bool = False, language: Language | None = None
+) -> list[str]:
+    """Return the "Gimatria" of each of the numbers, see `hebrew_number`."""
+    if (language or get_language()) != "he":
+        return [str(num) for num in numbers]
+    return [hebrew_number(num, short, "he") for num in numbers]
+
+
+def parse_hebrew_number(text: str) -> int:
+    """Return the value of a "Gimatria" number, in its short or long form.
+
+    >>> parse_hebrew_number('תשפ"ה')
+    785
+    """
+    value = _numeral_values().get(_normalize(text))
+    if value is None:
+        raise ValueError(f"Not a hebrew number: {text!r}")
+    return value
+
+
+def _hebrew_numeral(num: int, short: bool) -> str:
+    if not 0 <= num <= MAX_NUMBER:
         raise ValueError(f"num must be between 0 to 9999, got:{num}")
-    hstring = ""
+    letters = []
     if num >= 1000:
-        hstring += DIGITS[0][num // 1000]
-        hstring += "' "
+        letters.append(f"{DIGITS[0][num // 1000]}' ")
         num = num % 1000
-    while num >= 400:
-        hstring += DIGITS[2][4]
-        num = num - 400
+    letters.append(DIGITS[2][4] * (num // 400))
+    num = num % 400
     if num >= 100:
-        hstring += DIGITS[2][num // 100]
+        letters.append(DIGITS[2][num // 100])
         num = num % 100
     if num >= 10:
         if num in [15, 16]:
             num = num - 9
-        hstring += DIGITS[1][num // 10]
+        letters.append(DIGITS[1][num // 10])
         num = num % 10
     if num > 0:
-        hstring += DIGITS[0][num]
+        letters.append(DIGITS[0][num])
+    hstring = "".join(letters)
     # possibly add the ' and " to hebrew numbers
     if not short:
         if len(hstring) < 2:
@@ -40,3 +75,19 @@ def hebrew_number(num: int, short: bool = False) -> str:
         else:
             hstring = hstring[:-1] + '"' + hstring[-1]
     return hstring
+
+
+def _normalize(text: str) -> str:
+    """Use ASCII quotes for the geresh and gershayim."""
+    return text.replace("׳", "'").replace("״", '"')
+
+
+@bounded_cache("hebrew_number_values", 1)
+def _numeral_values() -> dict[str, int]:
+    """Return the value of each "Gimatria" number, built on first use."""
+    # 0 is left out, as its short form is empty and its long one a lone geresh
+    return {
+        hebrew_number(num, short, "he"): num
+        for short in (True, False)
+        for num in range(1, MAX_NUMBER + 1)
+    }
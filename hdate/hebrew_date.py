@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import datetime as dt
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import IntEnum
-from functools import cache, lru_cache
-from typing import TYPE_CHECKING, Callable, Literal
+from itertools import accumulate
+from typing import TYPE_CHECKING, Callable
 
 import hdate.converters as conv
+from hdate.cache import bounded_cache
 from hdate.gematria import hebrew_number
-from hdate.translator import TranslatorMixin
+from hdate.translator import Language, TranslatorMixin
+
+if TYPE_CHECKING:
+    from hdate.year_table import YearTable
 
 
 def get_chalakim(hours: int, parts: int) -> int:
@@ -23,6 +28,15 @@ PARTS_IN_DAY = 24 * PARTS_IN_HOUR
 PARTS_IN_WEEK = 7 * PARTS_IN_DAY
 PARTS_IN_MONTH = PARTS_IN_DAY + get_chalakim(12, 793)  # Fix for regular month
 
+# Julian day number of 1 Tishrei of year 1 and the mean length of a year (in days,
+# as a fraction) used to estimate the Hebrew year of a given Julian day.
+HEBREW_EPOCH_JDN = 347_998
+MEAN_YEAR_NUMERATOR, MEAN_YEAR_DENOMINATOR = 179_876_755, 492_480
+# Julian day number of Rosh Hashana = days since the molad of year 3744 + offset
+ROSH_HASHANA_OFFSET = 1_715_119
+
+_YEAR_TABLE: YearTable | None = None
+
 
 class Weekday(TranslatorMixin, IntEnum):
     """Enum class for the days of the week."""
@@ -51,7 +65,7 @@ def is_leap_year(year: int) -> bool:
     return year % 19 in (0, 3, 6, 8, 11, 14, 17)
 
 
-@lru_cache
+@bounded_cache("is_shabbat", maxsize=1024)
 def is_shabbat(date: dt.date | HebrewDate) -> bool:
     """Return whether a date is shabbat."""
     if isinstance(date, dt.date):
@@ -164,6 +178,76 @@ class Months(TranslatorMixin, IntEnum):
 LONG_MONTHS = tuple(month for month in Months if month.length == 30)
 SHORT_MONTHS = tuple(month for month in Months if month.length == 29)
 CHANGING_MONTHS = tuple(month for month in Months if callable(month.length))
+WEEKDAYS = tuple(Weekday)
+
+
+@dataclass(frozen=True)
+class YearLayout:
+    """Precomputed layout of a Hebrew year.
+
+    Holds the Julian day number of Rosh Hashana and the offset (in days) of the first
+    day of each month from Rosh Hashana, so that converting a date within the year is
+    a table lookup and an addition.
+    """
+
+    year: int
+    rosh_hashana: int
+    length: int
+    months: tuple[Months, ...]
+    starts: tuple[int, ...]
+    offsets: tuple[int, ...]
+
+    def day_of_year(self, month: Months, day: int) -> int:
+        """Return the number of days between Rosh Hashana and the given date."""
+        return self.offsets[month] + day - 1
+
+    def month_day(self, day_of_year: int) -> tuple[Months, int]:
+        """Return the month and day for a number of days since Rosh Hashana."""
+        index = bisect_right(self.starts, day_of_year) - 1
+        return self.months[index], day_of_year - self.starts[index] + 1
+
+
+def set_year_table(table: YearTable | None) -> None:
+    """Use a precomputed table of years as the backing store for the calculations."""
+    global _YEAR_TABLE  # pylint: disable=global-statement
+    _YEAR_TABLE = table
+    year_layout.cache_clear()
+    HebrewDate._days_from_3744.cache_clear()  # pylint: disable=W0212
+
+
+def rosh_hashana_jdn(year: int) -> int:
+    """Return the Julian day number of Rosh Hashana of the given year."""
+    if _YEAR_TABLE is not None and year in _YEAR_TABLE:
+        return _YEAR_TABLE.rosh_hashana(year)
+    days_from_3744 = HebrewDate._days_from_3744(year)  # pylint: disable=W0212
+    return days_from_3744 + ROSH_HASHANA_OFFSET
+
+
+@bounded_cache("year_layout", maxsize=1024)
+def year_layout(year: int) -> YearLayout:
+    """Return the layout of the given Hebrew year.
+
+    Months which don't exist in the given year (Adar in a leap year, Adar I and Adar II
+    otherwise) are mapped on to the Adar of that year.
+    """
+    months = tuple(Months.in_year(year))
+    lengths = [month.days(year) for month in months]
+    starts = tuple(accumulate(lengths[:-1], initial=0))
+    offsets = [0] * (len(Months) + 1)
+    for month, start in zip(months, starts):
+        offsets[month] = start
+    if is_leap_year(year):
+        offsets[Months.ADAR] = offsets[Months.ADAR_II]
+    else:
+        offsets[Months.ADAR_I] = offsets[Months.ADAR_II] = offsets[Months.ADAR]
+    return YearLayout(
+        year=year,
+        rosh_hashana=rosh_hashana_jdn(year),
+        length=starts[-1] + lengths[-1],
+        months=months,
+        starts=starts,
+        offsets=tuple(offsets),
+    )
 
 
 @dataclass(frozen=True)
@@ -198,7 +282,7 @@ class HebrewDate(TranslatorMixin):
 
         # Use the provided year to validate if it's not 0
         year = self.year if year == 0 else year
-        if validate_months and self.month not in Months.in_year(year):
+        if validate_months and self.month not in year_layout(year).months:
             raise ValueError(
                 f"{self.month} is not a valid month for year {year} "
                 f"({'leap' if is_leap_year(year) else 'non-leap'})"
@@ -225,10 +309,10 @@ class HebrewDate(TranslatorMixin):
             day = self.day
         return type(self)(year, month, day)
 
-    def __str__(self) -> str:
-        day = hebrew_number(self.day)
-        year = hebrew_number(self.year)
-        return f"{day} {self.month} {year}"
+    def format(self, language: Language | None = None) -> str:
+        day = hebrew_number(self.day, language=language)
+        year = hebrew_number(self.year, language=language)
+        return f"{day} {self.month.format(language)} {year}"
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, HebrewDate):
@@ -252,44 +336,43 @@ class HebrewDate(TranslatorMixin):
     def __add__(self, other: object) -> HebrewDate:
         if not isinstance(other, dt.timedelta):
             return NotImplemented
+        return self.add_days(other.days)
 
-        def _adjust_date(
-            year: int,
-            month: Months,
-            day: int,
-            direction: Literal["forward", "backward"],
-        ) -> tuple[int, Months, int]:
-            """Adjust the date based on the direction."""
-            if direction == "forward":
-                month = month.next_month(_year)
-                if month == Months.TISHREI:
-                    year += 1
-                day = 0
-            else:
-                month = month.prev_month(_year)
-                if month == Months.ELUL:
-                    year -= 1
-                day = month.days(_year)
-            return year, month, day
-
-        days = other.days
-        _year, _month, _day = self.year, self.month, self.day
-        while days != 0:
-            days_left = _month.days(_year) - _day if days > 0 else _day
+    def add_days(self, days: int) -> HebrewDate:
+        """Return the date which is the given number of days away from this date.
+
+        A date without a year (year 0) stays without a year, as long as the result
+        doesn't cross into the previous or next year.
+        """
+        if self.year != 0:
+            return type(self)(*self._split_jdn(self.to_jdn() + days))
+
+        # Without a year, Adar and Adar I/II can't share one layout, so walk the months
+        return type(self)(*self._walk_months(days))
 
+    def _walk_months(self, days: int) -> tuple[int, Months, int]:
+        """Move the given number of days away, one month at a time."""
+        year, month, day = self.year, self.month, self.day
+        while days != 0:
+            days_left = month.days(year) - day if days > 0 else day
             if days_left >= abs(days):
-                _day += days
-                if _day == 0:
-                    _year, _month, _day = _adjust_date(_year, _month, _day, "backward")
+                day += days
+                if day == 0:
+                    month = month.prev_month(year)
+                    year -= month == Months.ELUL
+                    day = month.days(year)
                 break
-
             if days > 0:
                 days -= days_left
-                _year, _month, _day = _adjust_date(_year, _month, _day, "forward")
+                month = month.next_month(year)
+                year += month == Months.TISHREI
+                day = 0
             else:
                 days += days_left
-                _year, _month, _day = _adjust_date(_year, _month, _day, "backward")
-        return type(self)(_year, _month, _day)
+                month = month.prev_month(year)
+                year -= month == Months.ELUL
+                day = month.days(year)
+        return year, month, day
 
     def __sub__(self, other: object) -> dt.timedelta:
         if not isinstance(other, HebrewDate):
@@ -309,36 +392,30 @@ class HebrewDate(TranslatorMixin):
 
     def to_jdn(self) -> int:
         """Compute Julian day number from HebrewDate."""
-        month = Months.TISHREI
-        day = HebrewDate._days_from_3744(self.year)
-        while month != self.month:
-            day += self.days_in_month(month)
-            month = month.next_month(self.year)
-        day += self.day
-        return day + 1715118
+        layout = year_layout(self.year)
+        return layout.rosh_hashana + layout.day_of_year(self.month, self.day)
+
+    @staticmethod
+    def _split_jdn(jdn: int) -> tuple[int, Months, int]:
+        """Return the Hebrew year, month and day of a Julian day."""
+        elapsed = jdn - HEBREW_EPOCH_JDN
+        year = elapsed * MEAN_YEAR_DENOMINATOR // MEAN_YEAR_NUMERATOR + 1
+        # Rosh Hashana may be postponed, so fix the estimate of the year if needed
+        while year_layout(year + 1).rosh_hashana <= jdn:
+            year += 1
+        while year_layout(year).rosh_hashana > jdn:
+            year -= 1
+        layout = year_layout(year)
+        return (year, *layout.month_day(jdn - layout.rosh_hashana))
 
     @staticmethod
-    @lru_cache
+    @bounded_cache("from_jdn", maxsize=4096)
     def from_jdn(jdn: int) -> HebrewDate:
         """Convert from the Julian day to the Hebrew day."""
-        # calculate Gregorian date
-        date = conv.jdn_to_gdate(jdn)
-
-        # Guess Hebrew year is Gregorian year + 3760
-        year = date.year + 3760
-
-        rosh_hashana = HebrewDate(year, Months.TISHREI, 1)
-
-        # Check if computed year was underestimated
-        if HebrewDate(year + 1, Months.TISHREI, 1).to_jdn() <= jdn:
-            rosh_hashana = HebrewDate(year + 1, Months.TISHREI, 1)
-
-        days = dt.timedelta(days=jdn - rosh_hashana.to_jdn())
-
-        return rosh_hashana + days
+        return HebrewDate(*HebrewDate._split_jdn(jdn))
 
     @staticmethod
-    @lru_cache
+    @bounded_cache("from_gdate", maxsize=4096)
     def from_gdate(date: dt.date) -> HebrewDate:
         """Return Hebrew date from Gregorian date."""
         return HebrewDate.from_jdn(conv.gdate_to_jdn(date))
@@ -348,7 +425,7 @@ class HebrewDate(TranslatorMixin):
         return conv.jdn_to_gdate(self.to_jdn())
 
     @staticmethod
-    @cache
+    @bounded_cache("days_from_3744", maxsize=2048)
     def _days_from_3744(hebrew_year: int) -> int:
         """Return: Number of days since the molad of year 3744."""
         # Start point for calculation is Molad new year 3744 (16BC)
@@ -399,12 +476,9 @@ class HebrewDate(TranslatorMixin):
         return days
 
     @staticmethod
-    @cache
     def year_size(hebrew_year: int) -> int:
         """Return: total days in hebrew year."""
-        return HebrewDate._days_from_3744(hebrew_year + 1) - HebrewDate._days_from_3744(
-            hebrew_year
-        )
+        return rosh_hashana_jdn(hebrew_year + 1) - rosh_hashana_jdn(hebrew_year)
 
     def days_in_month(self, month: Months) -> int:
         """Return the number of days in a month."""
@@ -416,8 +490,7 @@ class HebrewDate(TranslatorMixin):
 
     def dow(self) -> Weekday:
         """Return: day of the week."""
-        weekday = Weekday((self.to_jdn() + 1) % 7 + 1)
-        return weekday
+        return WEEKDAYS[(self.to_jdn() + 1) % 7]
 
     def short_kislev(self) -> bool:
         """Return whether this year has a short Kislev or not."""
@@ -426,3 +499,8 @@ class HebrewDate(TranslatorMixin):
     def long_cheshvan(self) -> bool:
         """Return whether this year has a long Cheshvan or not."""
         return long_cheshvan(self.year)
+
+
+# The last date (and its year) which can be converted to a Gregorian date
+LAST_GREGORIAN_DATE = HebrewDate.from_gdate(dt.date.max)
+LAST_GREGORIAN_YEAR = LAST_GREGORIAN_DATE.year
@@ -0,0 +1,216 @@
+"""Rules deciding on which dates a holiday falls, in a given year."""
+
+from __future__ import annotations
+
+import datetime as dt
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable
+
+from hdate.hebrew_date import (
+    WEEKDAYS,
+    HebrewDate,
+    Weekday,
+    short_kislev,
+    year_layout,
+)
+
+
+@dataclass(frozen=True)
+class DateRule(ABC):
+    """Base class for the rules deciding whether a holiday falls on a given date.
+
+    A rule may only depend on the weekday of the date, the length of its year and on
+    the position of the year relative to the rule's cutoffs. This lets the database
+    share a single calendar between all the years of the same type.
+
+    Besides checking a single date, a rule can be evaluated for a whole year at once
+    (`days`) or for many dates (`matches`).
+    """
+
+    @abstractmethod
+    def __call__(self, date: HebrewDate) -> bool:
+        """Return whether the rule holds for the given date."""
+
+    @property
+    def cutoffs(self) -> tuple[int, ...]:
+        """Return the years from which the rule's result may change."""
+        return ()
+
+    @property
+    def materializable(self) -> bool:
+        """Return whether the rule only depends on the type of year and the cutoffs.
+
+        Only the rules known to do so opt in, the other ones are evaluated for each
+        date.
+        """
+        return False
+
+    def days(self, year: int) -> frozenset[int]:
+        """Return the days of the year (0 on Rosh Hashana) for which the rule holds."""
+        layout = year_layout(year)
+        return frozenset(
+            day
+            for day in range(layout.length)
+            if self(HebrewDate(year, *layout.month_day(day)))
+        )
+
+    def matches(self, dates: Iterable[HebrewDate]) -> list[bool]:
+        """Return whether the rule holds for each of the dates."""
+        days: dict[int, frozenset[int]] = {}
+        result = []
+        for date in dates:
+            if date.year not in days:
+                days[date.year] = self.days(date.year)
+            day_of_year = year_layout(date.year).day_of_year(date.month, date.day)
+            result.append(day_of_year in days[date.year])
+        return result
+
+
+@dataclass(frozen=True)
+class WeekdayRule(DateRule):
+    """Holds if the date falls on (or with `exclude`, not on) one of the weekdays."""
+
+    weekdays: frozenset[Weekday]
+    exclude: bool = False
+
+    def __call__(self, date: HebrewDate) -> bool:
+        return (date.dow() in self.weekdays) != self.exclude
+
+    @property
+    def materializable(self) -> bool:
+        return True
+
+    def days(self, year: int) -> frozenset[int]:
+        layout = year_layout(year)
+        first = (layout.rosh_hashana + 1) % 7
+        offsets = {(WEEKDAYS.index(weekday) - first) % 7 for weekday in self.weekdays}
+        return frozenset(
+            day
+            for day in range(layout.length)
+            if ((day % 7) in offsets) != self.exclude
+        )
+
+
+@dataclass(frozen=True)
+class YearRule(DateRule):
+    """Holds if the year of the date is after and/or before the given years."""
+
+    after: int | None = None
+    before: int | None = None
+
+    def __call__(self, date: HebrewDate) -> bool:
+        return self._holds(date.year)
+
+    @property
+    def materializable(self) -> bool:
+        return True
+
+    @property
+    def cutoffs(self) -> tuple[int, ...]:
+        return tuple(
+            year
+            for year in (
+                None if self.after is None else self.after + 1,
+                self.before,
+            )
+            if year is not None
+        )
+
+    def days(self, year: int) -> frozenset[int]:
+        if not self._holds(year):
+            return frozenset()
+        return frozenset(range(year_layout(year).length))
+
+    def _holds(self, year: int) -> bool:
+        return (self.after is None or year > self.after) and (
+            self.before is None or year < self.before
+        )
+
+
+@dataclass(frozen=True)
+class KislevRule(DateRule):
+    """Holds if Kislev of the date's year is short (or long)."""
+
+    short: bool = True
+
+    def __call__(self, date: HebrewDate) -> bool:
+        return date.short_kislev() == self.short
+
+    @property
+    def materializable(self) -> bool:
+        return True
+
+    def days(self, year: int) -> frozenset[int]:
+        if short_kislev(year) != self.short:
+            return frozenset()
+        return frozenset(range(year_layout(year).length))
+
+
+@dataclass(frozen=True)
+class OffsetRule(DateRule):
+    """Holds if the rule holds for the date `offset` days away from the date."""
+
+    rule: DateRule
+    offset: int
+
+    def __call__(self, date: HebrewDate) -> bool:
+        return self.rule(date + dt.timedelta(days=self.offset))
+
+    @property
+    def cutoffs(self) -> tuple[int, ...]:
+        # The shifted date may fall in the previous or the next year
+        return tuple(
+            sorted({year + shift for year in self.rule.cutoffs for shift in (-1, 0, 1)})
+        )
+
+    @property
+    def materializable(self) -> bool:
+        # Shifting into another year depends on that year's type, which only matters
+        # for the rules depending on more than the weekday and the year number
+        return isinstance(self.rule, (WeekdayRule, YearRule, OffsetRule)) and (
+            self.rule.materializable
+        )
+
+    def days(self, year: int) -> frozenset[int]:
+        layout = year_layout(year)
+        inner_days = self.rule.days(year)
+        return frozenset(
+            day
+            for day in range(layout.length)
+            if (
+                day + self.offset in inner_days
+                if 0 <= day + self.offset < layout.length
+                else self(HebrewDate(year, *layout.month_day(day)))
+            )
+        )
+
+
+def not_on_dow(dow: list[Weekday]) -> DateRule:
+    """Return a rule checking that the date is not on one of the given weekdays."""
+    return WeekdayRule(frozenset(dow), exclude=True)
+
+
+def only_on_dow(dow: Weekday) -> DateRule:
+    """Return a rule checking that the date is on the given weekday."""
+    return WeekdayRule(frozenset((dow,)))
+
+
+def year_is_before(year: int) -> DateRule:
+    """Return a rule checking that the Hebrew year is before the requested year."""
+    return YearRule(before=year)
+
+
+def year_is_after(year: int) -> DateRule:
+    """Return a rule checking that the Hebrew year is after the requested year."""
+    return YearRule(after=year)
+
+
+def kislev_is_short() -> DateRule:
+    """Return a rule checking that Kislev has 29 days in the date's year."""
+    return KislevRule(short=True)
+
+
+def shifted(rule: DateRule, days: int) -> DateRule:
+    """Return a rule checking the given rule for the date `days` days away."""
+    return OffsetRule(rule, days)
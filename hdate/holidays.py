@@ -3,17 +3,47 @@
 from __future__ import annotations
 
 import datetime as dt
-from bisect import bisect_left
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from functools import lru_cache
-from itertools import product
-from typing import Callable, ClassVar, Iterable, Literal
+from itertools import islice, product
+from types import MappingProxyType
+from typing import (
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    Sequence,
+    overload,
+)
 
-from hdate.hebrew_date import CHANGING_MONTHS, LONG_MONTHS, HebrewDate, Months, Weekday
+from hdate.cache import bounded_cache
+from hdate.hebrew_date import (
+    CHANGING_MONTHS,
+    LAST_GREGORIAN_DATE,
+    LAST_GREGORIAN_YEAR,
+    LONG_MONTHS,
+    HebrewDate,
+    Months,
+    Weekday,
+    year_layout,
+)
+from hdate.holiday_rules import (
+    DateRule,
+    kislev_is_short,
+    not_on_dow,
+    only_on_dow,
+    year_is_after,
+    year_is_before,
+)
 from hdate.translator import TranslatorMixin
 
+MAX_DAYS_IN_YEAR = 385
+
 
 class HolidayTypes(Enum):
     """Container class for holiday type integer mappings."""
@@ -29,6 +59,31 @@ class HolidayTypes(Enum):
     ISRAEL_NATIONAL_HOLIDAY = 9
     ROSH_CHODESH = 10
 
+    @property
+    def bit(self) -> int:
+        """Return the bit of the holiday type in the day masks."""
+        return 1 << (self.value - 1)
+
+
+def types_mask(types: None | FilterType = None) -> int:
+    """Return the day mask bits of the given holiday types (all types by default)."""
+    if not types:
+        types = list(HolidayTypes)
+    elif isinstance(types, HolidayTypes):
+        types = [types]
+    mask = 0
+    for _type in types:
+        mask |= _type.bit
+    return mask
+
+
+def holidays_mask(holidays: Iterable[Holiday]) -> int:
+    """Return the day mask bits of the types of the given holidays (0 for none)."""
+    mask = 0
+    for holiday in holidays:
+        mask |= holiday.type.bit
+    return mask
+
 
 FilterType = list[HolidayTypes] | HolidayTypes
 
@@ -46,78 +101,367 @@ class Holiday(TranslatorMixin):
     israel_diaspora: Literal["ISRAEL", "DIASPORA", ""] = ""
 
 
-@dataclass
-class HolidayDatabase:
-    """Container class for holiday information."""
+@dataclass(frozen=True)
+class YearCalendar:
+    """The holidays of one type of year, indexed by the day of the year."""
+
+    days: tuple[tuple[Holiday, ...], ...]
+    holiday_days: tuple[int, ...]
+    # Days with holidays whose rules can't be materialized, checked on every lookup
+    pending: frozenset[int]
+    # The types of the holidays on each day, see `HolidayTypes.bit`
+    masks: array[int]
+    # The days of each holiday, by name
+    by_name: Mapping[str, tuple[int, ...]]
+
+    def holidays_on(self, day_of_year: int, date: HebrewDate) -> list[Holiday]:
+        """Return the holidays on the given day of the year (falling on `date`)."""
+        holidays = self.days[day_of_year]
+        if day_of_year not in self.pending:
+            return list(holidays)
+        return [
+            holiday
+            for holiday in holidays
+            if all(func(date) for func in holiday.date_functions_list)
+        ]
 
-    diaspora: bool
+    def extend(self, other: YearCalendar) -> YearCalendar:
+        """Return the calendar with the other calendar's holidays added after these.
+
+        Both calendars must be for the same type of year.
+        """
+        days = tuple(ours + theirs for ours, theirs in zip(self.days, other.days))
+        by_name = {
+            name: tuple(
+                sorted({*self.by_name.get(name, ()), *other.by_name.get(name, ())})
+            )
+            for name in (*self.by_name, *other.by_name)
+        }
+        return YearCalendar(
+            days,
+            tuple(day for day, holidays in enumerate(days) if holidays),
+            self.pending | other.pending,
+            array(
+                "H", (ours | theirs for ours, theirs in zip(self.masks, other.masks))
+            ),
+            MappingProxyType(by_name),
+        )
 
-    _diaspora_holidays: ClassVar[dict[HebrewDate, list[Holiday]]]
-    _israel_holidays: ClassVar[dict[HebrewDate, list[Holiday]]]
-    _all_holidays: ClassVar[dict[HebrewDate, list[Holiday]]]
 
-    def __post_init__(self) -> None:
-        # Use shallow copy instead of deepcopy for performance
-        self._instance_holidays = {k: v.copy() for k, v in self._all_holidays.items()}
-        if self.diaspora:
-            for date, holidays in self._diaspora_holidays.items():
-                self._instance_holidays.setdefault(date, []).extend(holidays)
-        else:
-            for date, holidays in self._israel_holidays.items():
-                self._instance_holidays.setdefault(date, []).extend(holidays)
+@dataclass(frozen=True)
+class HolidayIndex:
+    """Holidays indexed by (month, day), with the sorted dates for range queries.
 
-    @classmethod
-    def register_holidays(cls, holidays: list[Holiday]) -> None:
-        """Register a list of holidays with the holiday manager."""
+    The index also materializes a calendar per type of year: the weekday of Rosh
+    Hashana and the length of the year (which determine the keviah), and the era of
+    the year relative to the cutoffs of the year rules.
 
-        cls._diaspora_holidays = defaultdict(list)
-        cls._israel_holidays = defaultdict(list)
-        cls._all_holidays = defaultdict(list)
+    An index extended with more holidays builds its calendars from the calendars of
+    the original index, only placing the added holidays.
+    """
 
-        def holiday_dates_cross_product(
-            dates: tuple[Months | tuple[Months, ...], int | tuple[int, ...]],
-        ) -> Iterable[tuple[Months, int]]:
-            """Given a (days, months) pair, compute the cross product.
+    by_date: Mapping[tuple[Months, int], tuple[Holiday, ...]]
+    dates: tuple[HebrewDate, ...]
+    cutoffs: tuple[int, ...] = ()
+    opaque: frozenset[tuple[Months, int]] = frozenset()
+    _calendars: dict[tuple[int, int, int], YearCalendar] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+    # For an extended index, the original index and the index of the added holidays
+    _base: HolidayIndex | None = field(default=None, compare=False, repr=False)
+    _added: HolidayIndex | None = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def build(cls, holidays: Mapping[HebrewDate, Sequence[Holiday]]) -> HolidayIndex:
+        """Build the index from holidays keyed by (year-less) dates."""
+        dates = tuple(sorted(date for date, _holidays in holidays.items() if _holidays))
+        by_date = {(date.month, date.day): tuple(holidays[date]) for date in dates}
+        rules = [
+            (key, func)
+            for key, _holidays in by_date.items()
+            for holiday in _holidays
+            for func in holiday.date_functions_list
+        ]
+        cutoffs = sorted(
+            {
+                year
+                for _, rule in rules
+                if isinstance(rule, DateRule)
+                for year in rule.cutoffs
+            }
+        )
+        opaque = frozenset(
+            key
+            for key, rule in rules
+            if not isinstance(rule, DateRule) or not rule.materializable
+        )
+        return cls(MappingProxyType(by_date), dates, tuple(cutoffs), opaque)
+
+    def extend(self, added: HolidayIndex) -> HolidayIndex:
+        """Return an index with the holidays of the added index after this one's."""
+        if not added.dates:
+            return self
+        if not self.dates:
+            return added
+        by_date = dict(self.by_date)
+        for key, holidays in added.by_date.items():
+            by_date[key] = by_date.get(key, ()) + holidays
+        return HolidayIndex(
+            MappingProxyType(by_date),
+            tuple(sorted({*self.dates, *added.dates})),
+            tuple(sorted({*self.cutoffs, *added.cutoffs})),
+            self.opaque | added.opaque,
+            _base=self,
+            _added=added,
+        )
+
+    def next_date(self, date: HebrewDate) -> HebrewDate | None:
+        """Return the first date on or after the given one, valid for its year."""
+        for index in range(bisect_left(self.dates, date), len(self.dates)):
+            if self.dates[index].valid_for_year(date.year):
+                return self.dates[index].replace(year=date.year)
+        return None
+
+    def walk(
+        self, date: HebrewDate, reverse: bool = False
+    ) -> Iterator[tuple[HebrewDate, list[Holiday]]]:
+        """Yield the holidays from the given date on (or back), across years."""
+        if not self.dates:
+            return
+        year = date.year
+        day_of_year = year_layout(year).day_of_year(date.month, date.day)
+        while 0 < year <= LAST_GREGORIAN_YEAR:
+            layout, calendar = year_layout(year), self.calendar(year)
+            if reverse:
+                position = bisect_right(calendar.holiday_days, day_of_year)
+                days = reversed(calendar.holiday_days[:position])
+            else:
+                position = bisect_left(calendar.holiday_days, day_of_year)
+                days = iter(calendar.holiday_days[position:])
+            for day in days:
+                real_date = HebrewDate(year, *layout.month_day(day))
+                if holidays := calendar.holidays_on(day, real_date):
+                    yield real_date, holidays
+            year += -1 if reverse else 1
+            day_of_year = MAX_DAYS_IN_YEAR if reverse else 0
+
+    def calendar(self, year: int) -> YearCalendar:
+        """Return the calendar of the holidays for the given (non-relative) year."""
+        layout = year_layout(year)
+        key = (layout.rosh_hashana % 7, layout.length, bisect_right(self.cutoffs, year))
+        if (calendar := self._calendars.get(key)) is not None:
+            return calendar
+        if self._base is not None and self._added is not None:
+            # The cutoffs include the ones of both indexes, so their calendars are
+            # valid for all the years sharing the key
+            calendar = self._base.calendar(year).extend(self._added.calendar(year))
+        else:
+            calendar = self._build_calendar(year)
+        self._calendars[key] = calendar
+        return calendar
+
+    def _build_calendar(self, year: int) -> YearCalendar:
+        """Evaluate the rules of the holidays for the given year."""
+        layout = year_layout(year)
+        days: list[tuple[Holiday, ...]] = [()] * layout.length
+        rule_days: dict[DateRule, frozenset[int]] = {}
+        by_name: dict[str, list[int]] = defaultdict(list)
+
+        def holds(rule: DateRule, day_of_year: int) -> bool:
+            if rule not in rule_days:
+                rule_days[rule] = rule.days(year)
+            return day_of_year in rule_days[rule]
+
+        for _date in self.dates:
+            if not _date.valid_for_year(year):
+                continue
+            candidates = self.by_date[(_date.month, _date.day)]
+            day_of_year = layout.day_of_year(_date.month, _date.day)
+            if (_date.month, _date.day) not in self.opaque:
+                candidates = tuple(
+                    holiday
+                    for holiday in candidates
+                    if all(
+                        holds(rule, day_of_year)
+                        for rule in holiday.date_functions_list
+                        if isinstance(rule, DateRule)
+                    )
+                )
+            days[day_of_year] = candidates
+            for name in dict.fromkeys(holiday.name for holiday in candidates):
+                by_name[name].append(day_of_year)
+        return YearCalendar(
+            tuple(days),
+            tuple(day for day, holidays in enumerate(days) if holidays),
+            frozenset(
+                layout.day_of_year(*key) for key in self.opaque if key in self.by_date
+            ),
+            array("H", (holidays_mask(holidays) for holidays in days)),
+            MappingProxyType({name: tuple(_days) for name, _days in by_name.items()}),
+        )
+
+
+HolidayMap = Mapping[HebrewDate, tuple[Holiday, ...]]
 
-            If days and/or months are singletons, they are converted to a list.
-            """
-            months = (dates[0],) if isinstance(dates[0], Months) else dates[0]
-            days = (dates[1],) if isinstance(dates[1], int) else dates[1]
 
-            return product(months, days)
+@dataclass(frozen=True)
+class HolidayRegistry:
+    """An immutable snapshot of registered holidays, keyed by (year-less) dates.
+
+    Extending a registry returns a new snapshot, leaving this one untouched. The
+    merged holidays and the indexes are built on demand and cached in the snapshot,
+    so all the databases using it share them. The indexes of an extended snapshot
+    are built from the ones of the snapshot it extends, with the added holidays
+    placed after the existing ones on the same date.
+    """
 
+    all_holidays: HolidayMap = field(default_factory=lambda: MappingProxyType({}))
+    israel_holidays: HolidayMap = field(default_factory=lambda: MappingProxyType({}))
+    diaspora_holidays: HolidayMap = field(default_factory=lambda: MappingProxyType({}))
+    _merged: dict[bool, HolidayMap] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+    _indexes: dict[tuple[bool, frozenset[HolidayTypes]], HolidayIndex] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+    # For an extended registry, the registry it extends and the added holidays
+    _parent: HolidayRegistry | None = field(default=None, compare=False, repr=False)
+    _added: HolidayRegistry | None = field(default=None, compare=False, repr=False)
+
+    def extend(self, holidays: Iterable[Holiday]) -> HolidayRegistry:
+        """Return a new registry with the given holidays added to this one's."""
+        holidays = list(holidays)
+        added = self._add(HolidayRegistry(), holidays)
+        if not (self.all_holidays or self.israel_holidays or self.diaspora_holidays):
+            return added
+        return replace(self._add(self, holidays), _parent=self, _added=added)
+
+    @staticmethod
+    def _add(registry: HolidayRegistry, holidays: Iterable[Holiday]) -> HolidayRegistry:
+        """Return a registry with the holidays of both, ignoring how it was built."""
+        sources: dict[str, dict[HebrewDate, tuple[Holiday, ...]]] = {
+            "": dict(registry.all_holidays),
+            "ISRAEL": dict(registry.israel_holidays),
+            "DIASPORA": dict(registry.diaspora_holidays),
+        }
         for holiday in holidays:
+            target = sources[holiday.israel_diaspora]
             for date in holiday_dates_cross_product(holiday.date):
                 index = HebrewDate(0, *date)
-                if holiday.israel_diaspora == "ISRAEL":
-                    cls._israel_holidays[index].append(holiday)
-                elif holiday.israel_diaspora == "DIASPORA":
-                    cls._diaspora_holidays[index].append(holiday)
-                else:
-                    cls._all_holidays[index].append(holiday)
-
-    def _get_filtered_holidays(
-        self, types: None | FilterType
-    ) -> dict[HebrewDate, list[Holiday]]:
-        """Return a list of filtered holidays, based on type."""
-        filtered_holidays = self._instance_holidays.copy()
+                target[index] = target.get(index, ()) + (holiday,)
+        return HolidayRegistry(
+            all_holidays=MappingProxyType(sources[""]),
+            israel_holidays=MappingProxyType(sources["ISRAEL"]),
+            diaspora_holidays=MappingProxyType(sources["DIASPORA"]),
+        )
+
+    def merged(self, diaspora: bool) -> HolidayMap:
+        """Return the (shared, read-only) holidays for Israel or the diaspora."""
+        if (merged := self._merged.get(diaspora)) is not None:
+            return merged
+        holidays: dict[HebrewDate, list[Holiday]] = defaultdict(list)
+        if self._parent is not None and self._added is not None:
+            sources = (self._parent.merged(diaspora), self._added.merged(diaspora))
+        else:
+            local = self.diaspora_holidays if diaspora else self.israel_holidays
+            sources = (self.all_holidays, local)
+        for source in sources:
+            for date, date_holidays in source.items():
+                holidays[date].extend(date_holidays)
+        merged = self._merged[diaspora] = MappingProxyType(
+            {date: tuple(holidays[date]) for date in sorted(holidays)}
+        )
+        return merged
+
+    def index(self, diaspora: bool, types: None | FilterType) -> HolidayIndex:
+        """Return the index of the holidays of the given types.
+
+        Indexes are built once per snapshot, diaspora setting and set of types.
+        """
+        types = [types] if isinstance(types, HolidayTypes) else types
+        key = (diaspora, frozenset(types or ()))
+        if (index := self._indexes.get(key)) is not None:
+            return index
+        if self._parent is not None and self._added is not None:
+            index = self._indexes[key] = self._parent.index(diaspora, types).extend(
+                self._added.index(diaspora, types)
+            )
+            return index
+        holidays: Mapping[HebrewDate, Sequence[Holiday]] = self.merged(diaspora)
         if types:
-            types = [types] if isinstance(types, HolidayTypes) else types
-            filtered_holidays = {
-                _date: [holiday for holiday in holidays if holiday.type in types]
-                for _date, holidays in self._instance_holidays.items()
-                if any(holiday.type in types for holiday in holidays)
+            holidays = {
+                _date: [holiday for holiday in _holidays if holiday.type in types]
+                for _date, _holidays in holidays.items()
             }
-        return dict(sorted(filtered_holidays.items()))
+        index = self._indexes[key] = HolidayIndex.build(holidays)
+        return index
+
+
+def holiday_dates_cross_product(
+    dates: tuple[Months | tuple[Months, ...], int | tuple[int, ...]],
+) -> Iterable[tuple[Months, int]]:
+    """Given a (days, months) pair, compute the cross product.
+
+    If days and/or months are singletons, they are converted to a list.
+    """
+    months = (dates[0],) if isinstance(dates[0], Months) else dates[0]
+    days = (dates[1],) if isinstance(dates[1], int) else dates[1]
+
+    return product(months, days)
+
+
+@dataclass
+class HolidayDatabase:
+    """Container class for holiday information.
+
+    By default, the database uses the holidays registered with `register_holidays`.
+    Use `with_holidays` to get a database with additional holidays, without
+    affecting the other databases.
+    """
+
+    diaspora: bool
+    registry: HolidayRegistry = field(
+        default_factory=lambda: HolidayDatabase._default_registry, repr=False
+    )
+
+    _default_registry: ClassVar[HolidayRegistry] = HolidayRegistry()
+
+    def __post_init__(self) -> None:
+        self._instance_holidays = self.registry.merged(self.diaspora)
+
+    @classmethod
+    def register_holidays(cls, holidays: list[Holiday]) -> None:
+        """Register a list of holidays with the holiday manager.
+
+        The registered holidays replace the previous ones, for the databases created
+        from now on.
+        """
+        cls._default_registry = HolidayRegistry().extend(holidays)
+
+    def with_holidays(self, holidays: Iterable[Holiday]) -> HolidayDatabase:
+        """Return a database with the given holidays added to this one's.
+
+        The returned database keeps its own indexes, built from this database's by
+        only placing the added holidays, so it should be reused for looking up the
+        same set of holidays.
+        """
+        return HolidayDatabase(self.diaspora, self.registry.extend(holidays))
+
+    def _index(self, types: None | FilterType) -> HolidayIndex:
+        """Return the index of the holidays of the given types."""
+        return self.registry.index(self.diaspora, types)
 
     def lookup(
         self, date: HebrewDate, types: None | FilterType = None
     ) -> list[Holiday]:
         """Lookup the holidays for a given date."""
-        filtered_holidays = self._get_filtered_holidays(types)
-        if all(_date != date for _date in filtered_holidays):
-            return []
-        holidays = filtered_holidays[date.replace(year=0)]
+        index = self._index(types)
+        if date.year == 0:
+            holidays = index.by_date.get((date.month, date.day), ())
+        else:
+            calendar = index.calendar(date.year)
+            day_of_year = year_layout(date.year).day_of_year(date.month, date.day)
+            return calendar.holidays_on(day_of_year, date)
         return [
             holiday
             for holiday in holidays
@@ -128,39 +472,187 @@ class HolidayDatabase:
         self, date: HebrewDate, types: None | FilterType = None
     ) -> dict[HebrewDate, list[Holiday]]:
         """Lookup the holidays for a given year."""
-        filtered_holidays = self._get_filtered_holidays(types)
-        result = {
-            (real_date := _date.replace(year=date.year)): [
-                holiday
-                for holiday in holidays
-                if all(func(real_date) for func in holiday.date_functions_list)
-            ]
-            for _date, holidays in filtered_holidays.items()
-            if _date.valid_for_year(date.year)
-        }
-        return {
-            _date: _holidays
-            for _date, _holidays in result.items()
-            if len(_holidays) > 0
-        }
+        index = self._index(types)
+        if date.year == 0:
+            result = {
+                _date: [
+                    holiday
+                    for holiday in index.by_date[(_date.month, _date.day)]
+                    if all(func(_date) for func in holiday.date_functions_list)
+                ]
+                for _date in index.dates
+                if _date.valid_for_year(0)
+            }
+            return {
+                _date: _holidays for _date, _holidays in result.items() if _holidays
+            }
+        calendar = index.calendar(date.year)
+        layout = year_layout(date.year)
+        result = {}
+        for day_of_year in calendar.holiday_days:
+            real_date = HebrewDate(date.year, *layout.month_day(day_of_year))
+            if holidays := calendar.holidays_on(day_of_year, real_date):
+                result[real_date] = holidays
+        return result
 
     def lookup_next_holiday(
         self,
         date: HebrewDate,
         types: None | list[HolidayTypes] | HolidayTypes = None,
     ) -> HebrewDate:
-        """Lookup the next holiday for a given date (with optional type filter)."""
-        filtered_holidays = self._get_filtered_holidays(types)
-        valid_dates = [
-            _date
-            for _date in filtered_holidays.keys()
-            if _date.valid_for_year(date.year)
-        ]
-        next_date_idx = bisect_left(valid_dates, date)
-        if next_date_idx == len(valid_dates):
-            return HebrewDate(year=date.year + 1)
-        next_date = valid_dates[next_date_idx]
-        return next_date.replace(year=date.year)
+        """Lookup the next holiday for a given date (with optional type filter).
+
+        The given date is included in the search, which continues into the following
+        years if needed.
+        """
+        if date.year == 0:
+            next_date = self._index(types).next_date(date)
+        else:
+            next_date = next(iter(self.lookup_next_holidays(date, types)), None)
+        return next_date or HebrewDate(year=date.year + 1)
+
+    def lookup_previous_holiday(
+        self,
+        date: HebrewDate,
+        types: None | list[HolidayTypes] | HolidayTypes = None,
+    ) -> HebrewDate | None:
+        """Lookup the previous holiday for a given date (with optional type filter).
+
+        The given date is included in the search, which continues into the preceding
+        years if needed.
+        """
+        return next(iter(self.lookup_previous_holidays(date, types)), None)
+
+    def lookup_next_holidays(
+        self,
+        date: HebrewDate,
+        types: None | list[HolidayTypes] | HolidayTypes = None,
+        count: int = 1,
+    ) -> dict[HebrewDate, list[Holiday]]:
+        """Lookup the next `count` dates with holidays, from the given date on."""
+        return dict(islice(self._index(types).walk(date), count))
+
+    def lookup_previous_holidays(
+        self,
+        date: HebrewDate,
+        types: None | list[HolidayTypes] | HolidayTypes = None,
+        count: int = 1,
+    ) -> dict[HebrewDate, list[Holiday]]:
+        """Lookup the previous `count` dates with holidays, from the given date back.
+
+        The dates are ordered from the latest to the earliest.
+        """
+        return dict(islice(self._index(types).walk(date, reverse=True), count))
+
+    @overload
+    def iter_range(
+        self,
+        start: HebrewDate,
+        end: dt.date | HebrewDate,
+        types: None | FilterType = None,
+    ) -> Iterator[tuple[HebrewDate, list[Holiday]]]: ...
+
+    @overload
+    def iter_range(
+        self,
+        start: dt.date,
+        end: dt.date | HebrewDate,
+        types: None | FilterType = None,
+    ) -> Iterator[tuple[dt.date, list[Holiday]]]: ...
+
+    def iter_range(
+        self,
+        start: dt.date | HebrewDate,
+        end: dt.date | HebrewDate,
+        types: None | FilterType = None,
+    ) -> Iterator[tuple[dt.date | HebrewDate, list[Holiday]]]:
+        """Lazily yield the holidays from `start` (inclusive) to `end` (exclusive).
+
+        The dates are yielded in the same calendar as `start`. Gregorian dates stop
+        at the last date which can be converted (`datetime.date.max`).
+        """
+        gregorian = isinstance(start, dt.date)
+        if isinstance(start, dt.date):
+            start = HebrewDate.from_gdate(start)
+        if isinstance(end, dt.date):
+            end = HebrewDate.from_gdate(end)
+        for date, holidays in self._index(types).walk(start):
+            if date >= end or (gregorian and date > LAST_GREGORIAN_DATE):
+                return
+            yield (date.to_gdate() if gregorian else date), holidays
+
+    def day_masks(self, year: int) -> memoryview:
+        """Return the types of the holidays on each day of the year, as a bitmask.
+
+        The result is indexed by the day of the year (0 on Rosh Hashana), and each
+        day holds the `HolidayTypes.bit` of the types of its holidays.
+        """
+        calendar = self._index(None).calendar(year)
+        masks = calendar.masks
+        if calendar.pending:
+            layout = year_layout(year)
+            masks = array("H", masks)
+            for day in calendar.pending:
+                date = HebrewDate(year, *layout.month_day(day))
+                masks[day] = holidays_mask(calendar.holidays_on(day, date))
+        return memoryview(masks).toreadonly()
+
+    def is_holiday(self, date: HebrewDate, types: None | FilterType = None) -> bool:
+        """Return whether there is a holiday (of the given types) on the date."""
+        if date.year == 0:
+            return len(self.lookup(date, types)) > 0
+        day_of_year = year_layout(date.year).day_of_year(date.month, date.day)
+        return bool(self.day_masks(date.year)[day_of_year] & types_mask(types))
+
+    def any_holiday(
+        self,
+        start: dt.date | HebrewDate,
+        end: dt.date | HebrewDate,
+        types: None | FilterType = None,
+    ) -> bool:
+        """Return whether there is a holiday from `start` until `end` (exclusive)."""
+        if isinstance(start, dt.date):
+            start = HebrewDate.from_gdate(start)
+        if isinstance(end, dt.date):
+            end = HebrewDate.from_gdate(end)
+        mask = types_mask(types)
+        first = year_layout(start.year).day_of_year(start.month, start.day)
+        for year in range(start.year, end.year + 1):
+            last = (
+                year_layout(year).day_of_year(end.month, end.day)
+                if year == end.year
+                else MAX_DAYS_IN_YEAR
+            )
+            if any(day & mask for day in self.day_masks(year)[first:last]):
+                return True
+            first = 0
+        return False
+
+    def occurrences(
+        self, name: str, start_year: int, end_year: int
+    ) -> list[HebrewDate]:
+        """Return the dates of the named holiday from `start_year` until `end_year`.
+
+        The end year is excluded. A holiday spanning several days (e.g. chanukah) has
+        all its dates returned.
+        """
+        index = self._index(None)
+        if not any(
+            holiday.name == name
+            for holidays in index.by_date.values()
+            for holiday in holidays
+        ):
+            raise ValueError(f"Unknown holiday: {name}")
+        result = []
+        for year in range(max(start_year, 1), end_year):
+            calendar, layout = index.calendar(year), year_layout(year)
+            for day in calendar.by_name.get(name, ()):
+                date = HebrewDate(year, *layout.month_day(day))
+                if day not in calendar.pending or any(
+                    holiday.name == name for holiday in calendar.holidays_on(day, date)
+                ):
+                    result.append(date)
+        return result
 
     def get_all_names(self) -> list[str]:
         """Return all the holiday names."""
@@ -174,51 +666,12 @@ class HolidayDatabase:
         return list(sorted(result))
 
 
-@lru_cache
+@bounded_cache("is_yom_tov", maxsize=4096)
 def is_yom_tov(date: dt.date | HebrewDate, diaspora: bool = False) -> bool:
     """Helper method to check if a given date is a Yom Tov"""
     if isinstance(date, dt.date):
         date = HebrewDate.from_gdate(date)
-    holidays = HolidayDatabase(diaspora).lookup(date, types=HolidayTypes.YOM_TOV)
-    return len(holidays) > 0
-
-
-def not_on_dow(dow: list[Weekday]) -> Callable[[HebrewDate], bool]:
-    """
-    Return a lambda function.
-
-    Lambda checks that dow is not on one of the given weekdays.
-    """
-    return lambda x: x.dow() not in dow
-
-
-def only_on_dow(dow: Weekday) -> Callable[[HebrewDate], bool]:
-    """
-    Return a lambda function.
-
-    Lambda checks that dow is equal to the givem weekday.
-    """
-    return lambda x: x.dow() == dow
-
-
-def year_is_before(year: int) -> Callable[[HebrewDate], bool]:
-    """
-    Return a lambda function.
-
-    Lambda checks that a given HDate object's hebrew year is before the
-    requested year.
-    """
-    return lambda x: x.year < year
-
-
-def year_is_after(year: int) -> Callable[[HebrewDate], bool]:
-    """
-    Return a lambda function.
-
-    Lambda checks that a given HDate object's hebrew year is after the
-    requested year.
-    """
-    return lambda x: x.year > year
+    return HolidayDatabase(diaspora).is_holiday(date, HolidayTypes.YOM_TOV)
 
 
 HOLIDAYS = (
@@ -257,11 +710,12 @@ HOLIDAYS = (
         "chanukah",
         (Months.KISLEV, (25, 26, 27, 28, 29, 30)),
     ),
+    Holiday(HolidayTypes.MELACHA_PERMITTED_HOLIDAY, "chanukah", (Months.TEVET, (1, 2))),
     Holiday(
         HolidayTypes.MELACHA_PERMITTED_HOLIDAY,
         "chanukah",
-        (Months.TEVET, (1, 2, 3)),
-        [lambda x: ((x.short_kislev() and x.day == 3) or (x.day in [1, 2]))],
+        (Months.TEVET, 3),
+        [kislev_is_short()],
     ),
     Holiday(HolidayTypes.FAST_DAY, "asara_btevet", (Months.TEVET, 10)),
     Holiday(HolidayTypes.MINOR_HOLIDAY, "tu_bshvat", (Months.SHVAT, 15)),
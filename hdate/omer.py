@@ -4,11 +4,10 @@ from dataclasses import dataclass
 from datetime import timedelta
 from enum import Enum, auto
 
-from num2words import lang_HE, num2words
-
+from hdate.cache import bounded_cache
 from hdate.gematria import hebrew_number
 from hdate.hebrew_date import HebrewDate, Months
-from hdate.translator import TranslatorMixin, get_language
+from hdate.translator import Language, TranslatorMixin, get_language
 
 
 class Nusach(Enum):
@@ -56,21 +55,33 @@ class Omer(TranslatorMixin):
             self.total_days = self.week * 7 + self.day
             self.date = first_omer_day + timedelta(days=self.total_days - 1)
 
-    def __str__(self) -> str:
+    def format(self, language: Language | None = None) -> str:
         if self.total_days == 0:
             return ""
         if self.nusach == Nusach.ASHKENAZ:
-            suffix = self.get_translation(f"in_omer_{self.nusach.name}")
+            suffix = self.get_translation(f"in_omer_{self.nusach.name}", language)
         else:
-            suffix = self.get_translation("in_omer")
-        return f"{hebrew_number(self.total_days)} {suffix}"
+            suffix = self.get_translation("in_omer", language)
+        return f"{hebrew_number(self.total_days, language=language)} {suffix}"
 
     def count_str(self) -> str:
         """Return the text to be said when counting the omer."""
         if self.total_days == 0:
             return ""
+        return self._count_str(self.total_days, self.nusach, get_language())
+
+    @staticmethod
+    @bounded_cache("omer_count_str", maxsize=1024)
+    def _count_str(total_days: int, nusach: Nusach, language: Language) -> str:
+        """Return the (cached) text for the day of the omer, in the given language."""
+        omer = Omer(total_days=total_days, nusach=nusach)
+        return omer._build_count_str(language)  # pylint: disable=W0212
 
-        language = get_language()
+    def _build_count_str(self, language: Language) -> str:
+        """Build the text to be said when counting the omer, in the given language."""
+        # num2words is only needed when the text isn't cached yet
+        # pylint: disable-next=import-outside-toplevel
+        from num2words import lang_HE, num2words
 
         def num2words_omer(number: int, _type: str = "total") -> str:
             """Wrapper for num2words."""
@@ -92,9 +103,9 @@ class Omer(TranslatorMixin):
                     count = f"{count_ones} ו{count_tens}"
                 else:
                     count = conv.to_cardinal(number, gender="m", construct=construct)
-                _obj = self.get_translation(type_name)
+                _obj = self.get_translation(type_name, language)
                 return f"{count} {_obj}" if number > 1 else f"{_obj} {count}"
-            _obj = self.get_translation(type_name)
+            _obj = self.get_translation(type_name, language)
             count = num2words(number, lang=language[:2], to=to)
             if language == "en" and _type == "total":
                 count = f"the {count}"
@@ -104,24 +115,24 @@ class Omer(TranslatorMixin):
 
         total_days = num2words_omer(self.total_days, _type="total")
         in_omer = (
-            self.get_translation("in_omer")
+            self.get_translation("in_omer", language)
             if self.nusach != Nusach.ASHKENAZ
-            else self.get_translation("in_omer_ashkenaz")
+            else self.get_translation("in_omer_ashkenaz", language)
         )
-        _is = self.get_translation("is")
+        _is = self.get_translation("is", language)
         prefix = (
-            f"{self.get_translation('today')} {_is}".strip()
+            f"{self.get_translation('today', language)} {_is}".strip()
             if self.nusach != Nusach.ITALIAN
-            else f"{self.get_translation('today')} {in_omer} {_is}".strip()
+            else f"{self.get_translation('today', language)} {in_omer} {_is}".strip()
         )
         detail = ""
         if self.week > 0:
-            which_are = self.get_translation("which_are")
+            which_are = self.get_translation("which_are", language)
             weeks = num2words_omer(self.week, _type="week")
             detail = f" {which_are} {weeks}"
             detail = f",{detail}" if language != "he" else detail
             if self.day > 0:
-                _and = self.get_translation("and")
+                _and = self.get_translation("and", language)
                 _and = f"{_and} " if language != "he" else _and
                 days = num2words_omer(self.day, _type="day")
                 detail = f"{detail} {_and}{days}"
@@ -3,9 +3,18 @@
 import datetime as dt
 from dataclasses import dataclass
 from enum import Enum, IntEnum, auto
-from typing import ClassVar, cast
+from typing import ClassVar, cast, overload
 
-from hdate.hebrew_date import HebrewDate, Months, Weekday
+from hdate.cache import bounded_cache
+from hdate.hebrew_date import (
+    LAST_GREGORIAN_DATE,
+    LAST_GREGORIAN_YEAR,
+    WEEKDAYS,
+    HebrewDate,
+    Months,
+    Weekday,
+    year_layout,
+)
 from hdate.translator import TranslatorMixin
 
 
@@ -90,6 +99,15 @@ class Parasha(TranslatorMixin, IntEnum):
     NITZAVIM_VAYEILECH = auto()
 
 
+@dataclass(frozen=True)
+class YearReadings:
+    """The weekly readings of a year, counted from the week of Rosh Hashana."""
+
+    rosh_hashana: int  # Julian day number
+    weekday: Weekday  # Weekday of Rosh Hashana
+    readings: tuple[Enum, ...]
+
+
 @dataclass
 class ParashaDatabase:
     """Container class for parasha information."""
@@ -97,35 +115,127 @@ class ParashaDatabase:
     diaspora: bool
 
     _all_parashas: ClassVar[dict[tuple[int, ...], tuple[Enum, ...]]]
+    _by_year_type: ClassVar[dict[int, tuple[Enum, ...]]]
 
     @classmethod
     def register(cls, parashas: dict[tuple[int, ...], tuple[Enum, ...]]) -> None:
         """Register the different parasha sequences."""
         cls._all_parashas = parashas
+        cls._by_year_type = {
+            year_type: readings
+            for year_types, readings in parashas.items()
+            for year_type in year_types
+        }
+        cls.year_readings.cache_clear()
 
-    def lookup(self, date: HebrewDate) -> Parasha:
-        """Lookup the parasha for a given date."""
-        _year_type = (date.year_size(date.year) % 10) - 3
-        rosh_hashana = HebrewDate(date.year, Months.TISHREI, 1)
-        pesach = HebrewDate(date.year, Months.NISAN, 15)
+    @staticmethod
+    @bounded_cache("parasha_year_readings", maxsize=256)
+    def year_readings(year: int, diaspora: bool) -> YearReadings:
+        """Return the weekly readings of the given year."""
+        layout = year_layout(year)
+        weekday = WEEKDAYS[(layout.rosh_hashana + 1) % 7]
+        pesach = layout.rosh_hashana + layout.day_of_year(Months.NISAN, 15)
         year_type = (
-            self.diaspora * 1000
-            + rosh_hashana.dow() * 100
-            + _year_type * 10
-            + pesach.dow()
+            diaspora * 1000
+            + weekday * 100
+            + ((layout.length % 10) - 3) * 10
+            + WEEKDAYS[(pesach + 1) % 7]
         )
+        readings = ParashaDatabase._by_year_type[year_type]
+        return YearReadings(layout.rosh_hashana, weekday, readings)
+
+    def lookup(self, date: HebrewDate) -> Parasha:
+        """Lookup the parasha for a given date."""
+        year = self.year_readings(date.year, self.diaspora)
+        reading = self._reading(year, date.to_jdn())
+        # Maybe recompute the year type based on the upcoming shabbat.
+        # This avoids an edge case where today is before Rosh Hashana but
+        # Shabbat is in a new year afterwards.
+        if (
+            reading is None
+            and date.year
+            < (
+                next_shabbat := (
+                    date + dt.timedelta(days=Weekday.SATURDAY - date.dow())
+                )
+            ).year
+        ):
+            return self.lookup(next_shabbat)
+        if reading is None:
+            raise ValueError(f"No reading found for {date!r}")
+        return reading
+
+    def schedule(self, year: int) -> list[tuple[HebrewDate, Parasha]]:
+        """Return the readings of all the Shabbatot in the given year.
 
+        Shabbatot falling on a holiday, with no weekly reading, have `Parasha.NONE`.
+        """
+        readings, layout = self.year_readings(year, self.diaspora), year_layout(year)
+        result = []
+        for day in range(Weekday.SATURDAY - readings.weekday, layout.length, 7):
+            if (
+                reading := self._reading(readings, readings.rosh_hashana + day)
+            ) is None:
+                break
+            result.append((HebrewDate(year, *layout.month_day(day)), reading))
+        return result
+
+    @overload
+    def next_reading(
+        self, parasha: Parasha, after: HebrewDate, count: int = 1
+    ) -> list[HebrewDate]: ...
+
+    @overload
+    def next_reading(
+        self, parasha: Parasha, after: dt.date, count: int = 1
+    ) -> list[dt.date]: ...
+
+    def next_reading(
+        self, parasha: Parasha, after: HebrewDate | dt.date, count: int = 1
+    ) -> list[HebrewDate] | list[dt.date]:
+        """Return the next `count` Shabbatot after the given date reading `parasha`.
+
+        The dates are returned in the same calendar as `after`. Gregorian dates stop
+        at the last date which can be converted (`datetime.date.max`).
+        """
+        if not any(
+            parasha in readings
+            for year_type, readings in self._by_year_type.items()
+            if (year_type >= 1000) == self.diaspora
+        ):
+            return []
+        start = HebrewDate.from_gdate(after) if isinstance(after, dt.date) else after
+        result: list[HebrewDate] = []
+        year = start.year
+        while len(result) < count and year <= LAST_GREGORIAN_YEAR:
+            if parasha in self.year_readings(year, self.diaspora).readings:
+                result.extend(
+                    shabbat
+                    for shabbat, reading in self.schedule(year)
+                    if reading == parasha and shabbat > start
+                )
+            year += 1
+        if isinstance(after, dt.date):
+            return [
+                shabbat.to_gdate()
+                for shabbat in result[:count]
+                if shabbat <= LAST_GREGORIAN_DATE
+            ]
+        return result[:count]
+
+    def _reading(self, year: YearReadings, jdn: int) -> Parasha | None:
+        """Return the reading for a day of the year, None if past its readings."""
         # Number of days since rosh hashana
-        days = (date - rosh_hashana).days
+        days = jdn - year.rosh_hashana
         # Number of weeks since rosh hashana
-        weeks = (days + rosh_hashana.dow() - 1) // 7
+        weeks = (days + year.weekday - 1) // 7
 
         # If it's currently Simchat Torah, return VeZot Haberacha.
         if weeks == 3:
             if (
                 days <= 22
                 and self.diaspora
-                and date.dow() != Weekday.SATURDAY
+                and WEEKDAYS[(jdn + 1) % 7] != Weekday.SATURDAY
                 or days <= 21
                 and not self.diaspora
             ):
@@ -135,23 +245,9 @@ class ParashaDatabase:
         if weeks == 4 and days == 22 and self.diaspora:
             return Parasha.VEZOT_HABRACHA
 
-        readings = next(
-            seq for types, seq in self._all_parashas.items() if year_type in types
-        )
-        # Maybe recompute the year type based on the upcoming shabbat.
-        # This avoids an edge case where today is before Rosh Hashana but
-        # Shabbat is in a new year afterwards.
-        if (
-            weeks >= len(readings)
-            and date.year
-            < (
-                next_shabbat := (
-                    date + dt.timedelta(days=Weekday.SATURDAY - date.dow())
-                )
-            ).year
-        ):
-            return self.lookup(next_shabbat)
-        return cast(Parasha, readings[weeks])
+        if weeks >= len(year.readings):
+            return None
+        return cast(Parasha, year.readings[weeks])
 
 
 PARASHA_SEQUENCES: dict[tuple[int, ...], tuple[Enum, ...]] = {
@@ -1,658 +0,0 @@
-"""
-This file was generated by utils/translations.py
-Do not edit this file manually.
-"""
-
-# pylint: disable=line-too-long
-# flake8: noqa: E501
-
-TRANSLATIONS = {
-    "en": {
-        "Months": {
-            "tishrei": "Tishrei",
-            "marcheshvan": "Marcheshvan",
-            "kislev": "Kislev",
-            "tevet": "Tevet",
-            "shvat": "Sh'vat",
-            "adar": "Adar",
-            "nisan": "Nisan",
-            "iyyar": "Iyyar",
-            "sivan": "Sivan",
-            "tammuz": "Tammuz",
-            "av": "Av",
-            "elul": "Elul",
-            "adar_i": "Adar I",
-            "adar_ii": "Adar II",
-        },
-        "Masechta": {
-            "berachos": "Berachos",
-            "shabbos": "Shabbos",
-            "eruvin": "Eruvin",
-            "pesachim": "Pesachim",
-            "shekalim": "Shekalim",
-            "yoma": "Yoma",
-            "succah": "Succah",
-            "beitzah": "Beitzah",
-            "rosh_hashanah": "Rosh Hashanah",
-            "taanis": "Taanis",
-            "megillah": "Megillah",
-            "moed_katan": "Moed Katan",
-            "chagigah": "Chagigah",
-            "yevamos": "Yevamos",
-            "kesubos": "Kesubos",
-            "nedarim": "Nedarim",
-            "nazir": "Nazir",
-            "sotah": "Sotah",
-            "gittin": "Gittin",
-            "kiddushin": "Kiddushin",
-            "bava_kamma": "Bava Kamma",
-            "bava_metzia": "Bava Metzia",
-            "bava_basra": "Bava Basra",
-            "sanhedrin": "Sanhedrin",
-            "makkos": "Makkos",
-            "shevuos": "Shevuos",
-            "avodah_zarah": "Avodah Zarah",
-            "horayos": "Horayos",
-            "zevachim": "Zevachim",
-            "menachos": "Menachos",
-            "chullin": "Chullin",
-            "bechoros": "Bechoros",
-            "arachin": "Arachin",
-            "temurah": "Temurah",
-            "kereisos": "Kereisos",
-            "meilah": "Meilah",
-            "niddah": "Niddah",
-        },
-        "Holiday": {
-            "erev_rosh_hashana": "Erev Rosh Hashana",
-            "rosh_hashana_i": "Rosh Hashana I",
-            "rosh_hashana_ii": "Rosh Hashana II",
-            "tzom_gedaliah": "Tzom Gedaliah",
-            "erev_yom_kippur": "Erev Yom Kippur",
-            "yom_kippur": "Yom Kippur",
-            "erev_sukkot": "Erev Sukkot",
-            "sukkot": "Sukkot",
-            "hol_hamoed_sukkot": "Hol hamoed Sukkot",
-            "hoshana_raba": "Hoshana Raba",
-            "simchat_torah": "Simchat Torah",
-            "chanukah": "Chanukah",
-            "asara_btevet": "Asara B'Tevet",
-            "tu_bshvat": "Tu B'Shvat",
-            "taanit_esther": "Ta'anit Esther",
-            "purim": "Purim",
-            "shushan_purim": "Shushan Purim",
-            "erev_pesach": "Erev Pesach",
-            "pesach": "Pesach",
-            "hol_hamoed_pesach": "Hol hamoed Pesach",
-            "pesach_vii": "Pesach VII",
-            "yom_haatzmaut": "Yom HaAtzma'ut",
-            "lag_bomer": "Lag B'Omer",
-            "erev_shavuot": "Erev Shavuot",
-            "shavuot": "Shavuot",
-            "tzom_tammuz": "Tzom Tammuz",
-            "tisha_bav": "Tish'a B'Av",
-            "tu_bav": "Tu B'Av",
-            "yom_hashoah": "Yom HaShoah",
-            "yom_hazikaron": "Yom HaZikaron",
-            "yom_yerushalayim": "Yom Yerushalayim",
-            "shmini_atzeret": "Shmini Atzeret",
-            "pesach_viii": "Pesach VIII",
-            "shavuot_ii": "Shavuot II",
-            "sukkot_ii": "Sukkot II",
-            "pesach_ii": "Pesach II",
-            "family_day": "Family Day",
-            "memorial_day_unknown": "Memorial day for fallen whose place of burial is unknown",
-            "rabin_memorial_day": "Yitzhak Rabin memorial day",
-            "zeev_zhabotinsky_day": "Zeev Zhabotinsky day",
-            "rosh_chodesh": "Rosh Chodesh",
-        },
-        "Zman": {
-            "alot_hashachar": "Alot HaShachar",
-            "talit_and_tefillin": "Talit & Tefilin's time",
-            "netz_hachama": "Sunrise",
-            "sof_zman_shema_mga": 'Shema EOT MG"A',
-            "sof_zman_shema_gra": 'Shema EOT GR"A',
-            "sof_zman_tfilla_mga": 'Tefila EOT MG"A',
-            "sof_zman_tfilla_gra": 'Tefila EOT GR"A',
-            "chatzot_hayom": "Midday",
-            "mincha_gedola": "Big Mincha",
-            "mincha_gedola_30min": "Big Mincha 30 min",
-            "mincha_ketana": "Small Mincha",
-            "plag_hamincha": "Plag Mincha",
-            "shkia": "Sunset",
-            "tset_hakohavim_tsom": "End of fast",
-            "tset_hakohavim_shabbat": "End of Shabbat",
-            "tset_hakohavim": "Tset Hakochavim (18 minutes)",
-            "tset_hakohavim_rabeinu_tam": "Night by Rabbeinu Tam",
-            "chatzot_halayla": "Midnight",
-        },
-        "Parasha": {
-            "none": "none",
-            "bereshit": "Bereshit",
-            "noach": "Noach",
-            "lech_lecha": "Lech-Lecha",
-            "vayera": "Vayera",
-            "chayei_sara": "Chayei Sara",
-            "toldot": "Toldot",
-            "vayetzei": "Vayetzei",
-            "vayishlach": "Vayishlach",
-            "vayeshev": "Vayeshev",
-            "miketz": "Miketz",
-            "vayigash": "Vayigash",
-            "vayechi": "Vayechi",
-            "shemot": "Shemot",
-            "vaera": "Vaera",
-            "bo": "Bo",
-            "beshalach": "Beshalach",
-            "yitro": "Yitro",
-            "mishpatim": "Mishpatim",
-            "terumah": "Terumah",
-            "tetzaveh": "Tetzaveh",
-            "ki_tisa": "Ki Tisa",
-            "vayakhel": "Vayakhel",
-            "pekudei": "Pekudei",
-            "vayikra": "Vayikra",
-            "tzav": "Tzav",
-            "shmini": "Shmini",
-            "tazria": "Tazria",
-            "metzora": "Metzora",
-            "achrei_mot": "Achrei Mot",
-            "kedoshim": "Kedoshim",
-            "emor": "Emor",
-            "behar": "Behar",
-            "bechukotai": "Bechukotai",
-            "bamidbar": "Bamidbar",
-            "nasso": "Nasso",
-            "behaalotcha": "Beha'alotcha",
-            "shlach": "Sh'lach",
-            "korach": "Korach",
-            "chukat": "Chukat",
-            "balak": "Balak",
-            "pinchas": "Pinchas",
-            "matot": "Matot",
-            "masei": "Masei",
-            "devarim": "Devarim",
-            "vaetchanan": "Vaetchanan",
-            "eikev": "Eikev",
-            "reeh": "Re'eh",
-            "shoftim": "Shoftim",
-            "ki_teitzei": "Ki Teitzei",
-            "ki_tavo": "Ki Tavo",
-            "nitzavim": "Nitzavim",
-            "vayeilech": "Vayeilech",
-            "haazinu": "Ha'Azinu",
-            "vezot_habracha": "Vezot Habracha",
-            "vayakhel_pekudei": "Vayakhel-Pekudei",
-            "tazria_metzora": "Tazria-Metzora",
-            "achrei_mot_kedoshim": "Achrei Mot-Kedoshim",
-            "behar_bechukotai": "Behar-Bechukotai",
-            "chukat_balak": "Chukat-Balak",
-            "matot_masei": "Matot-Masei",
-            "nitzavim_vayeilech": "Nitzavim-Vayeilech",
-        },
-        "Weekday": {
-            "sunday": "Sunday",
-            "monday": "Monday",
-            "tuesday": "Tuesday",
-            "wednesday": "Wednesday",
-            "thursday": "Thursday",
-            "friday": "Friday",
-            "saturday": "Saturday",
-        },
-        "Gevurot": {
-            "morid_hatal": "Morid ha-tal",
-            "mashiv_haruach": "Mashiv ha-ruach u-morid ha-geshem",
-            "neither": "(Silence)",
-        },
-        "Geshamim": {
-            "barkheinu": "Barkheinu",
-            "barech_aleinu": "Barech aleinu",
-            "veten_tal": "VeTen Tal uMatar Livracha",
-            "veten_beracha": "VeTen Beracha",
-        },
-        "Omer": {
-            "today": "Today",
-            "which_are": "which are",
-            "is": "is",
-            "day": "day",
-            "days": "days",
-            "and": "and",
-            "week": "week",
-            "weeks": "weeks",
-            "in_omer_ashkenaz": "of the Omer",
-            "in_omer": "of the Omer",
-        },
-    },
-    "fr": {
-        "Months": {
-            "tishrei": "Tishri",
-            "marcheshvan": "Heshvan",
-            "kislev": "Kislev",
-            "tevet": "Tevet",
-            "shvat": "Shvat",
-            "adar": "Adar",
-            "nisan": "Nissan",
-            "iyyar": "Iyar",
-            "sivan": "Sivan",
-            "tammuz": "Tamouz",
-            "av": "Av",
-            "elul": "Eloul",
-            "adar_i": "Adar I",
-            "adar_ii": "Adar II",
-        },
-        "Masechta": {
-            "berachos": "Berakhot",
-            "shabbos": "Shabbat",
-            "eruvin": "Erouvin",
-            "pesachim": "Pessa'him",
-            "shekalim": "Chekalim",
-            "yoma": "Yoma",
-            "succah": "Soucca",
-            "beitzah": "Beitsa",
-            "rosh_hashanah": "Roch Hachana",
-            "taanis": "Ta'anit",
-            "megillah": "Meguila",
-            "moed_katan": "Moëd Katan",
-            "chagigah": "Haguiga",
-            "yevamos": "Yevamot",
-            "kesubos": "Ketouvot",
-            "nedarim": "Nédarim",
-            "nazir": "Nazir",
-            "sotah": "Sota",
-            "gittin": "Guittin",
-            "kiddushin": "Kidouchin",
-            "bava_kamma": "Baba Kama",
-            "bava_metzia": "Baba Metsia",
-            "bava_basra": "Baba Batra",
-            "sanhedrin": "Sanhedrin",
-            "makkos": "Makot",
-            "shevuos": "Chevouot",
-            "avodah_zarah": "Avoda Zara",
-            "horayos": "Horayot",
-            "zevachim": "Zevahim",
-            "menachos": "Menahot",
-            "chullin": "Houlin",
-            "bechoros": "Bekhorot",
-            "arachin": "Arakhin",
-            "temurah": "Temoura",
-            "kereisos": "Keritot",
-            "meilah": "Me'ila",
-            "niddah": "Nida",
-        },
-        "Holiday": {
-            "erev_rosh_hashana": "Veille de Rosh Hashana",
-            "rosh_hashana_i": "Rosh Hashana I",
-            "rosh_hashana_ii": "Rosh Hashana II",
-            "tzom_gedaliah": "Jeûne de Guedalia",
-            "erev_yom_kippur": "Veille de Yom Kippour",
-            "yom_kippur": "Yom Kippour",
-            "erev_sukkot": "Veille de Souccot",
-            "sukkot": "Souccot",
-            "hol_hamoed_sukkot": "Hol hamoed Souccot",
-            "hoshana_raba": "Hoshaâna Rabba",
-            "simchat_torah": "Simhat Torah",
-            "chanukah": "Hanoukka",
-            "asara_btevet": "10 Tevet",
-            "tu_bshvat": "Tou Bichvat",
-            "taanit_esther": "Jeûne d'Esther",
-            "purim": "Pourim",
-            "shushan_purim": "Pourim Shoushan",
-            "erev_pesach": "Veille de Pessah",
-            "pesach": "Pessah",
-            "hol_hamoed_pesach": "Hol hamoed Pessah",
-            "pesach_vii": "Pessah VII",
-            "yom_haatzmaut": "Yom HaAtsmaout",
-            "lag_bomer": "Lag Ba Omer",
-            "erev_shavuot": "Veille de Shavouot",
-            "shavuot": "Shavouot",
-            "tzom_tammuz": "Jeûne du 17 Tamouz",
-            "tisha_bav": "Tisha Be'Av",
-            "tu_bav": "Tou be'Av",
-            "yom_hashoah": "Yom HaShoah",
-            "yom_hazikaron": "Yom haZicaron",
-            "yom_yerushalayim": "Yom Yeroushalaïm",
-            "shmini_atzeret": "Shemini Atseret",
-            "pesach_viii": "Pessah VIII",
-            "shavuot_ii": "Shavouot II",
-            "sukkot_ii": "Souccot II",
-            "pesach_ii": "Pessah II",
-            "family_day": "Fête de la Famille",
-            "memorial_day_unknown": "Jour du souvenir",
-            "rabin_memorial_day": "Jour commémoratif Yitzhak Rabin",
-            "zeev_zhabotinsky_day": "Jour de Zeev Zhabotinsky",
-            "rosh_chodesh": "Rosh Hodesh",
-        },
-        "Zman": {
-            "alot_hashachar": "Alot HaShahar",
-            "talit_and_tefillin": "Début Talit & Tefilin ",
-            "netz_hachama": "Lever du jour",
-            "sof_zman_shema_mga": 'Shema MG"A',
-            "sof_zman_shema_gra": 'Shema GR"A',
-            "sof_zman_tfilla_mga": 'Tefila MG"A',
-            "sof_zman_tfilla_gra": 'Tefila GR"A',
-            "chatzot_hayom": "Hatsot",
-            "mincha_gedola": "Minha Guedola",
-            "mincha_gedola_30min": "Minha Guedola 30 min",
-            "mincha_ketana": "Minha Qetana",
-            "plag_hamincha": "Plag haMinha",
-            "shkia": "Shqiat",
-            "tset_hakohavim_tsom": "Fin du jeune",
-            "tset_hakohavim_shabbat": "Fin de Shabbat",
-            "tset_hakohavim": "Tzeit haCokhavim (18 minutes)",
-            "tset_hakohavim_rabeinu_tam": "Nuit selon Rabbénou Tam",
-            "chatzot_halayla": "Hatsot laïla",
-        },
-        "Parasha": {
-            "none": "none",
-            "bereshit": "Bereshit",
-            "noach": "Noa'h",
-            "lech_lecha": "Lekh Lekha",
-            "vayera": "Vayera",
-            "chayei_sara": "Haye Sarah",
-            "toldot": "Toledot",
-            "vayetzei": "Vayetze",
-            "vayishlach": "Vayishla'h",
-            "vayeshev": "Vayeshev",
-            "miketz": "Miketz",
-            "vayigash": "Vayigash",
-            "vayechi": "Vaye'hi",
-            "shemot": "Shemot",
-            "vaera": "Va'era",
-            "bo": "Bo",
-            "beshalach": "Beshalakh",
-            "yitro": "Yitro",
-            "mishpatim": "Mishpatim",
-            "terumah": "Teroumah",
-            "tetzaveh": "Tetzave",
-            "ki_tisa": "Ki Tissa",
-            "vayakhel": "Vayaqhel",
-            "pekudei": "Peqoudei",
-            "vayikra": "Vayikra",
-            "tzav": "Tzav",
-            "shmini": "Shemini",
-            "tazria": "Tazria",
-            "metzora": "Metzora",
-            "achrei_mot": "A'harei Mot",
-            "kedoshim": "Kedoshim",
-            "emor": "Emor",
-            "behar": "Behar",
-            "bechukotai": "Be'houkotai",
-            "bamidbar": "Bamidbar",
-            "nasso": "Nasso",
-            "behaalotcha": "Beha'alotkha",
-            "shlach": "Shla'h lekha",
-            "korach": "Kora'h",
-            "chukat": "Houkat",
-            "balak": "Balak",
-            "pinchas": "Pin'has",
-            "matot": "Matot",
-            "masei": "Massei",
-            "devarim": "Devarim",
-            "vaetchanan": "Va'et'hanan",
-            "eikev": "Eikev",
-            "reeh": "Re'eh",
-            "shoftim": "Shoftim",
-            "ki_teitzei": "Ki Tetze",
-            "ki_tavo": "Ki Tavo",
-            "nitzavim": "Nitzavim",
-            "vayeilech": "Vayelekh",
-            "haazinu": "Haazinou",
-            "vezot_habracha": "Vezot Haberakha",
-            "vayakhel_pekudei": "Vayaqhel-Peqoudei",
-            "tazria_metzora": "Tazria-Metzora",
-            "achrei_mot_kedoshim": "A'harei Mot-Kedoshim",
-            "behar_bechukotai": "Behar-Be'houkotai",
-            "chukat_balak": "Houkat-Balak",
-            "matot_masei": "Matot-Massei",
-            "nitzavim_vayeilech": "Nitzavim-Vayelekh",
-        },
-        "Weekday": {
-            "sunday": "Dimanche",
-            "monday": "Lundi",
-            "tuesday": "Mardi",
-            "wednesday": "Mercredi",
-            "thursday": "Jeudi",
-            "friday": "Vendredi",
-            "saturday": "Samedi",
-        },
-        "Gevurot": {
-            "morid_hatal": "Moride ha-tal",
-            "mashiv_haruach": "Machiv ha-roua'h oumoride ha-guéchem",
-            "neither": "(Silence)",
-        },
-        "Geshamim": {
-            "barkheinu": "Barkhénou",
-            "barech_aleinu": "Barech aleinu",
-            "veten_tal": "VeTen Tal uMatar Livracha",
-            "veten_beracha": "VeTen Beracha",
-        },
-        "Omer": {
-            "today": "Aujourd'hui",
-            "is": "c'est le",
-            "which_are": "ce qui fait",
-            "day": "jour",
-            "days": "jours",
-            "and": "et",
-            "week": "semaine",
-            "weeks": "semaines",
-            "in_omer_ashkenaz": "de l'Omer",
-            "in_omer": "de l'Omer",
-        },
-    },
-    "he": {
-        "Months": {
-            "tishrei": "תשרי",
-            "marcheshvan": "מרחשוון",
-            "kislev": "כסלו",
-            "tevet": "טבת",
-            "shvat": "שבט",
-            "adar": "אדר",
-            "nisan": "ניסן",
-            "iyyar": "אייר",
-            "sivan": "סיון",
-            "tammuz": "תמוז",
-            "av": "אב",
-            "elul": "אלול",
-            "adar_i": "אדר א",
-            "adar_ii": "אדר ב",
-        },
-        "Masechta": {
-            "berachos": "ברכות",
-            "shabbos": "שבת",
-            "eruvin": "עירובין",
-            "pesachim": "פסחים",
-            "shekalim": "שקלים",
-            "yoma": "יומא",
-            "succah": "סוכה",
-            "beitzah": "ביצה",
-            "rosh_hashanah": "ראש השנה",
-            "taanis": "תענית",
-            "megillah": "מגילה",
-            "moed_katan": "מועד קטן",
-            "chagigah": "חגיגה",
-            "yevamos": "יבמות",
-            "kesubos": "כתובות",
-            "nedarim": "נדרים",
-            "nazir": "נזיר",
-            "sotah": "סוטה",
-            "gittin": "גיטין",
-            "kiddushin": "קידושין",
-            "bava_kamma": "בבא קמא",
-            "bava_metzia": "בבא מציעא",
-            "bava_basra": "בבא בתרא",
-            "sanhedrin": "סנהדרין",
-            "makkos": "מכות",
-            "shevuos": "שבועות",
-            "avodah_zarah": "עבודה זרה",
-            "horayos": "הוריות",
-            "zevachim": "זבחים",
-            "menachos": "מנחות",
-            "chullin": "חולין",
-            "bechoros": "בכורות",
-            "arachin": "ערכין",
-            "temurah": "תמורה",
-            "kereisos": "כריתות",
-            "meilah": "מעילה",
-            "niddah": "נדה",
-        },
-        "Holiday": {
-            "erev_rosh_hashana": "ערב ראש השנה",
-            "rosh_hashana_i": "א' ראש השנה",
-            "rosh_hashana_ii": "ב' ראש השנה",
-            "tzom_gedaliah": "צום גדליה",
-            "erev_yom_kippur": 'עיוה"כ',
-            "yom_kippur": "יום הכפורים",
-            "erev_sukkot": "ערב סוכות",
-            "sukkot": "סוכות",
-            "hol_hamoed_sukkot": "חול המועד סוכות",
-            "hoshana_raba": "הושענא רבה",
-            "simchat_torah": "שמחת תורה",
-            "chanukah": "חנוכה",
-            "asara_btevet": "צום עשרה בטבת",
-            "tu_bshvat": 'ט"ו בשבט',
-            "taanit_esther": "תענית אסתר",
-            "purim": "פורים",
-            "shushan_purim": "שושן פורים",
-            "erev_pesach": "ערב פסח",
-            "pesach": "פסח",
-            "hol_hamoed_pesach": "חול המועד פסח",
-            "pesach_vii": "שביעי פסח",
-            "yom_haatzmaut": "יום העצמאות",
-            "lag_bomer": 'ל"ג בעומר',
-            "erev_shavuot": "ערב שבועות",
-            "shavuot": "שבועות",
-            "tzom_tammuz": "צום שבעה עשר בתמוז",
-            "tisha_bav": "תשעה באב",
-            "tu_bav": 'ט"ו באב',
-            "yom_hashoah": "יום השואה",
-            "yom_hazikaron": "יום הזכרון",
-            "yom_yerushalayim": "יום ירושלים",
-            "shmini_atzeret": "שמיני עצרת",
-            "pesach_viii": "אחרון של פסח",
-            "shavuot_ii": "שני של שבועות",
-            "sukkot_ii": "שני של סוכות",
-            "pesach_ii": "שני של פסח",
-            "family_day": "יום המשפחה",
-            "memorial_day_unknown": "יום זכרון...",
-            "rabin_memorial_day": "יום הזכרון ליצחק רבין",
-            "zeev_zhabotinsky_day": "יום ז'בוטינסקי",
-            "rosh_chodesh": "ראש חודש",
-        },
-        "Zman": {
-            "alot_hashachar": "עלות השחר",
-            "talit_and_tefillin": "זמן טלית ותפילין",
-            "netz_hachama": "הנץ החמה",
-            "sof_zman_shema_mga": 'סוף זמן ק"ש מג"א',
-            "sof_zman_shema_gra": 'סוף זמן ק"ש גר"א',
-            "sof_zman_tfilla_mga": 'סוף זמן תפילה מג"א',
-            "sof_zman_tfilla_gra": 'סוף זמן תפילה גר"א',
-            "chatzot_hayom": "חצות היום",
-            "mincha_gedola": "מנחה גדולה",
-            "mincha_gedola_30min": "מנחה גדולה 30 דק",
-            "mincha_ketana": "מנחה קטנה",
-            "plag_hamincha": "פלג המנחה",
-            "shkia": "שקיעה",
-            "tset_hakohavim_tsom": "מוצאי צום",
-            "tset_hakohavim_shabbat": "מוצאי שבת",
-            "tset_hakohavim": "צאת הכוכבים (18 דק)",
-            "tset_hakohavim_rabeinu_tam": "לילה לרבנו תם",
-            "chatzot_halayla": "חצות הלילה",
-        },
-        "Parasha": {
-            "none": "none",
-            "bereshit": "בראשית",
-            "noach": "נח",
-            "lech_lecha": "לך לך",
-            "vayera": "וירא",
-            "chayei_sara": "חיי שרה",
-            "toldot": "תולדות",
-            "vayetzei": "ויצא",
-            "vayishlach": "וישלח",
-            "vayeshev": "וישב",
-            "miketz": "מקץ",
-            "vayigash": "ויגש",
-            "vayechi": "ויחי",
-            "shemot": "שמות",
-            "vaera": "וארא",
-            "bo": "בא",
-            "beshalach": "בשלח",
-            "yitro": "יתרו",
-            "mishpatim": "משפטים",
-            "terumah": "תרומה",
-            "tetzaveh": "תצוה",
-            "ki_tisa": "כי תשא",
-            "vayakhel": "ויקהל",
-            "pekudei": "פקודי",
-            "vayikra": "ויקרא",
-            "tzav": "צו",
-            "shmini": "שמיני",
-            "tazria": "תזריע",
-            "metzora": "מצורע",
-            "achrei_mot": "אחרי מות",
-            "kedoshim": "קדושים",
-            "emor": "אמור",
-            "behar": "בהר",
-            "bechukotai": "בחוקתי",
-            "bamidbar": "במדבר",
-            "nasso": "נשא",
-            "behaalotcha": "בהעלתך",
-            "shlach": "שלח",
-            "korach": "קרח",
-            "chukat": "חקת",
-            "balak": "בלק",
-            "pinchas": "פנחס",
-            "matot": "מטות",
-            "masei": "מסעי",
-            "devarim": "דברים",
-            "vaetchanan": "ואתחנן",
-            "eikev": "עקב",
-            "reeh": "ראה",
-            "shoftim": "שופטים",
-            "ki_teitzei": "כי תצא",
-            "ki_tavo": "כי תבוא",
-            "nitzavim": "נצבים",
-            "vayeilech": "וילך",
-            "haazinu": "האזינו",
-            "vezot_habracha": "וזאת הברכה",
-            "vayakhel_pekudei": "ויקהל-פקודי",
-            "tazria_metzora": "תזריע-מצורע",
-            "achrei_mot_kedoshim": "אחרי מות-קדושים",
-            "behar_bechukotai": "בהר-בחוקתי",
-            "chukat_balak": "חוקת-בלק",
-            "matot_masei": "מטות מסעי",
-            "nitzavim_vayeilech": "נצבים-וילך",
-        },
-        "Weekday": {
-            "sunday": "יום ראשון",
-            "monday": "יום שני",
-            "tuesday": "יום שלישי",
-            "wednesday": "יום רביעי",
-            "thursday": "יום חמישי",
-            "friday": "יום שישי",
-            "saturday": "יום שבת",
-        },
-        "Gevurot": {
-            "morid_hatal": "מוֹרִיד הַטַּל",
-            "mashiv_haruach": "מַשִּׁיב הָרוּחַ וּמוֹרִיד הַגֶּשֶׁם",
-            "neither": "(שתיקה)",
-        },
-        "Geshamim": {
-            "barkheinu": "בָּרְכֵנוּ",
-            "barech_aleinu": "בָּרֵךְ עָלֵינוּ",
-            "veten_tal": "וְתֵן טַל וּמָטָר לִבְרָכָה",
-            "veten_beracha": "וְתֵן בְּרָכָה",
-        },
-        "Omer": {
-            "in_omer": "לעומר",
-            "in_omer_ashkenaz": "בעומר",
-            "is": "",
-            "and": "ו",
-            "today": "היום",
-            "day": "יום",
-            "days": "ימים",
-            "week": "שבוע",
-            "weeks": "שבועות",
-            "which_are": "שהם",
-        },
-    },
-}
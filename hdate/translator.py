@@ -4,21 +4,27 @@ Classes using the translator base-classes will be able to pick up the correct st
 based on the language specified.
 """
 
+import json
 import logging
+import sys
 from contextvars import ContextVar
-from typing import Literal
+from importlib.resources import files
+from typing import Any, Literal
 
-from hdate.translations import TRANSLATIONS
+from hdate.cache import bounded_cache
 
 _LOGGER = logging.getLogger(__name__)
 
+# The translations are kept as one JSON file per language, loaded on first use
+_TRANSLATIONS_DIR = files("hdate") / "translations"
+
 Language = Literal["en", "fr", "he"]
 context_language: ContextVar[Language] = ContextVar("context_language", default="he")
 
 
 def set_language(language: Language) -> None:
     """Set the current translation language (context-local)."""
-    if language not in TRANSLATIONS:
+    if language not in _languages():
         _LOGGER.warning("Language %s not found, falling back to hebrew", language)
         language = "he"
     _ = context_language.set(language)
@@ -29,6 +35,47 @@ def get_language() -> Language:
     return context_language.get()
 
 
+@bounded_cache("translation_languages", 1)
+def _languages() -> tuple[str, ...]:
+    """Return the languages which have a translations file."""
+    return tuple(
+        sorted(
+            path.name.removesuffix(".json")
+            for path in _TRANSLATIONS_DIR.iterdir()
+            if path.name.endswith(".json")
+        )
+    )
+
+
+def _intern_strings(obj: dict[str, Any]) -> dict[str, Any]:
+    return {
+        sys.intern(key): sys.intern(value) if isinstance(value, str) else value
+        for key, value in obj.items()
+    }
+
+
+@bounded_cache("translation_files", None)
+def _load_language(language: str) -> dict[str, dict[str, str]]:
+    """Load the translations file of a language."""
+    text = (_TRANSLATIONS_DIR / f"{language}.json").read_text(encoding="utf-8")
+    translations: dict[str, dict[str, str]] = json.loads(
+        text, object_hook=_intern_strings
+    )
+    return translations
+
+
+@bounded_cache("class_translations", 256)
+def _class_translations(class_name: str, language: str) -> dict[str, str]:
+    """Return the translations of a class in the given language."""
+    return _load_language(language).get(class_name, {})
+
+
+@bounded_cache("translated_names", 4096)
+def _translate(class_name: str, key: str, language: str) -> str | None:
+    """Return the translation of a key of a class, None if there is none."""
+    return _class_translations(class_name, language).get(key.lower())
+
+
 class TranslatorMixin:
     """Translator Mixin class.
 
@@ -37,8 +84,15 @@ class TranslatorMixin:
     """
 
     def __str__(self) -> str:
+        return self.format()
+
+    def format(self, language: Language | None = None) -> str:
+        """Return the object rendered in the given language.
+
+        Defaults to the current language, see `set_language`.
+        """
         if name := getattr(self, "name", None):
-            return self.get_translation(name)
+            return self.get_translation(name, language)
         raise NameError(
             f"Unable to translate {self.__class__.__name__}. "
             "It is missing the name attribute"
@@ -46,18 +100,18 @@ class TranslatorMixin:
 
     def available_languages(self) -> list[str]:
         """Return a list of available languages."""
-        return list(TRANSLATIONS.keys())
+        return list(_languages())
 
     @property
     def translations(self) -> dict[str, str]:
         """Load the translations for the class."""
         lang = get_language()[:2]
         # lang will always be valid if set_language is called
-        return TRANSLATIONS[lang].get(self.__class__.__name__, {})
+        return _class_translations(self.__class__.__name__, lang)
 
-    def get_translation(self, key: str) -> str:
+    def get_translation(self, key: str, language: Language | None = None) -> str:
         """Return the translation for the given key."""
-        value = self.translations.get(key.lower(), None)
+        value = _translate(self.__class__.__name__, key, language or get_language())
         if value is None:
             _LOGGER.error("Translation for %s not found", key)
             value = key
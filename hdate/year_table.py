@@ -0,0 +1,121 @@
+"""Precomputed table of Hebrew years.
+
+The table holds, for every year in a range (1-9999 by default), the Julian day number
+of Rosh Hashana, the length of the year, the weekday of Rosh Hashana and whether the
+year is a leap year. It is stored as a compact binary file which can be memory mapped
+read-only, so that many processes share a single copy of it.
+
+>>> from hdate import year_table
+>>> table = year_table.YearTable.build(5780, 5790)
+>>> table.record(5785)
+YearRecord(rosh_hashana=2460587, length=355, weekday=<Weekday.THURSDAY: 5>, leap=False)
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from hdate import hebrew_date
+from hdate.hebrew_date import Weekday, is_leap_year
+
+MAGIC = b"HDYT"
+HEADER = struct.Struct("<4sii")  # magic, first year, number of years
+RECORD = struct.Struct("<iHBB")  # rosh hashana JDN, length, weekday, leap
+FIRST_YEAR = 1
+LAST_YEAR = 9999
+
+
+class YearRecord(NamedTuple):
+    """Information about a single Hebrew year."""
+
+    rosh_hashana: int
+    length: int
+    weekday: Weekday
+    leap: bool
+
+
+@dataclass(frozen=True)
+class YearTable:
+    """Read-only table of Hebrew years, backed by a bytes-like buffer."""
+
+    buffer: bytes | mmap.mmap
+    first_year: int
+    last_year: int
+
+    @classmethod
+    def from_buffer(cls, buffer: bytes | mmap.mmap) -> YearTable:
+        """Create a table from a buffer holding a table file."""
+        magic, first_year, count = HEADER.unpack_from(buffer)
+        if magic != MAGIC or len(buffer) != HEADER.size + count * RECORD.size:
+            raise ValueError("Buffer does not hold a valid year table")
+        return cls(buffer, first_year, first_year + count - 1)
+
+    @classmethod
+    def build(
+        cls, first_year: int = FIRST_YEAR, last_year: int = LAST_YEAR
+    ) -> YearTable:
+        """Compute a table for the given (inclusive) range of years."""
+        return cls.from_buffer(pack(first_year, last_year))
+
+    def __contains__(self, year: object) -> bool:
+        return isinstance(year, int) and self.first_year <= year <= self.last_year
+
+    def _offset(self, year: int) -> int:
+        if year not in self:
+            raise KeyError(f"Year {year} is not in the table")
+        return HEADER.size + (year - self.first_year) * RECORD.size
+
+    def rosh_hashana(self, year: int) -> int:
+        """Return the Julian day number of Rosh Hashana of the given year."""
+        return int(RECORD.unpack_from(self.buffer, self._offset(year))[0])
+
+    def record(self, year: int) -> YearRecord:
+        """Return all the information stored for the given year."""
+        rosh_hashana, length, weekday, leap = RECORD.unpack_from(
+            self.buffer, self._offset(year)
+        )
+        return YearRecord(rosh_hashana, length, Weekday(weekday), bool(leap))
+
+
+def pack(first_year: int = FIRST_YEAR, last_year: int = LAST_YEAR) -> bytes:
+    """Compute the binary table for the given (inclusive) range of years."""
+    if first_year < 1 or last_year < first_year:
+        raise ValueError(f"Invalid range of years: {first_year}-{last_year}")
+    days_from_3744 = hebrew_date.HebrewDate._days_from_3744  # pylint: disable=W0212
+    records = bytearray(HEADER.pack(MAGIC, first_year, last_year - first_year + 1))
+    for year in range(first_year, last_year + 1):
+        rosh_hashana = days_from_3744(year) + hebrew_date.ROSH_HASHANA_OFFSET
+        length = days_from_3744(year + 1) - days_from_3744(year)
+        weekday = (rosh_hashana + 1) % 7 + 1
+        records += RECORD.pack(rosh_hashana, length, weekday, is_leap_year(year))
+    return bytes(records)
+
+
+def generate(
+    path: str | os.PathLike[str],
+    first_year: int = FIRST_YEAR,
+    last_year: int = LAST_YEAR,
+) -> None:
+    """Write the table for the given range of years to a file."""
+    with open(path, "wb") as table_file:
+        table_file.write(pack(first_year, last_year))
+
+
+def load(path: str | os.PathLike[str]) -> YearTable:
+    """Memory map a table file (read-only)."""
+    with open(path, "rb") as table_file:
+        buffer = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+    return YearTable.from_buffer(buffer)
+
+
+def install(table: YearTable | None) -> None:
+    """Use the given table for all the Hebrew date calculations.
+
+    Years outside of the table are still calculated. Passing None goes back to
+    calculating all the years.
+    """
+    hebrew_date.set_year_table(table)
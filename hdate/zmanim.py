@@ -15,7 +15,7 @@ from typing import cast
 from hdate.hebrew_date import is_shabbat
 from hdate.holidays import is_yom_tov
 from hdate.location import Location
-from hdate.translator import TranslatorMixin
+from hdate.translator import Language, TranslatorMixin
 
 try:
     import astral
@@ -73,9 +73,12 @@ class Zmanim(TranslatorMixin):  # pylint: disable=too-many-instance-attributes
         self._today_is_yom_tov = is_yom_tov(self.date, self.location.diaspora)
         self._tomorrow_is_yom_tov = is_yom_tov(tomorrow, self.location.diaspora)
 
-    def __str__(self) -> str:
+    def format(self, language: Language | None = None) -> str:
         return "\n".join(
-            [f"{zman} - {zman.local.time()}" for _, zman in self.zmanim.items()]
+            [
+                f"{zman.format(language)} - {zman.local.time()}"
+                for _, zman in self.zmanim.items()
+            ]
         )
 
     def __getattr__(self, name: str) -> Zman:
@@ -0,0 +1,88 @@
+"""Tests for the bounded caches."""
+
+import subprocess
+import sys
+
+import pytest
+
+from hdate import cache
+
+
+@cache.bounded_cache("test_square", maxsize=2)
+def square(number: int) -> int:
+    """Return the square of a number."""
+    return number * number
+
+
+def test_bounded_cache_statistics() -> None:
+    """Hits, misses and evictions are counted."""
+    square.cache_clear()
+    for number in (1, 2, 1, 3, 4, 4):
+        assert square(number) == number * number
+    info = square.cache_info()
+    assert (info.hits, info.misses, info.evictions) == (2, 4, 2)
+    assert (info.maxsize, info.currsize) == (2, 2)
+    assert info.hit_rate == pytest.approx(1 / 3)
+
+
+def test_failed_calls_are_not_evictions() -> None:
+    """Calls which raise are misses, but don't add entries to evict."""
+    inverse = cache.BoundedCache(lambda number: 1 / number, "test_inverse", maxsize=2)
+    for _ in range(3):
+        with pytest.raises(ZeroDivisionError):
+            inverse(0)
+    assert inverse(2) == 0.5
+    info = inverse.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (0, 4, 0, 1)
+    inverse.cache_clear()
+    assert inverse(1) == 1
+    assert inverse.cache_info().evictions == 0
+
+
+def test_configure() -> None:
+    """Caches can be resized by name."""
+    cache.configure(test_square=5)
+    try:
+        assert cache.cache_info()["test_square"].maxsize == 5
+    finally:
+        cache.configure(test_square=2)
+
+
+def test_configure_before_registration() -> None:
+    """The size of a cache configured before it's registered is kept until it is."""
+    cache.configure(test_pending=3)
+    assert "test_pending" not in cache.cache_info()
+    pending = cache.bounded_cache("test_pending", maxsize=1)(abs)
+    assert pending.cache_info().maxsize == 3
+    assert cache.cache_info()["test_pending"].maxsize == 3
+
+
+def test_duplicate_name() -> None:
+    """Cache names are unique."""
+    with pytest.raises(ValueError):
+        cache.bounded_cache("test_square", maxsize=1)(abs)
+
+
+def test_package_surface() -> None:
+    """The hdate caches are available from the package, in a fresh interpreter."""
+    code = """
+import hdate
+
+hdate.cache.configure(is_yom_tov=100, omer_count_str=10)
+hdate.HebrewDate.from_jdn(2460681)
+hdate.HebrewDate.from_jdn(2460681)
+assert "is_yom_tov" not in hdate.cache_info()
+hdate.HDateInfo()
+info = hdate.cache_info()
+assert {"from_jdn", "from_gdate", "year_layout", "is_yom_tov"} <= info.keys()
+assert info["is_yom_tov"].maxsize == 100
+assert info["from_jdn"].hits >= 1
+import hdate.omer
+
+assert hdate.cache_info()["omer_count_str"].maxsize == 10
+hdate.cache_clear()
+assert hdate.cache_info()["from_jdn"].currsize == 0
+"""
+    subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
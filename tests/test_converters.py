@@ -2,10 +2,11 @@
 
 import datetime as dt
 
-from hypothesis import given, strategies
+import pytest
+from hypothesis import given, settings, strategies
 
 from hdate import converters as conv
-from hdate.hebrew_date import HebrewDate
+from hdate.hebrew_date import HebrewDate, Months
 from tests.conftest import valid_hebrew_date
 
 
@@ -19,3 +20,71 @@ def test_gdate_to_gdate(date: dt.date) -> None:
 def test_hdate_to_hdate(date: HebrewDate) -> None:
     """Transform Hebrew date to Hebrew date (single Adar)."""
     assert HebrewDate.from_jdn(date.to_jdn()) == date
+
+
+@given(dates=strategies.lists(strategies.dates(), max_size=50))
+@settings(deadline=None)  # The first batch computes the layouts of many years
+def test_batch_gdates_to_hebrew(dates: list[dt.date]) -> None:
+    """Batch conversion matches converting one date at a time."""
+    np = pytest.importorskip("numpy")
+    ordinals = np.array([date.toordinal() for date in dates], dtype=np.int64)
+    years, months, days = conv.gdates_to_hebrew(ordinals)
+    expected = [HebrewDate.from_gdate(date) for date in dates]
+    result = zip(years.tolist(), months.tolist(), days.tolist())
+    assert [HebrewDate(*date) for date in result] == expected
+    assert conv.hebrew_to_gdates(years, months, days).tolist() == ordinals.tolist()
+
+
+def test_batch_datetime64() -> None:
+    """Batch conversion accepts datetime64 arrays."""
+    np = pytest.importorskip("numpy")
+    dates = np.array(["2025-01-05", "2024-10-03"], dtype="datetime64[D]")
+    years, months, days = conv.gdates_to_hebrew(dates)
+    assert years.tolist() == [5785, 5785]
+    assert months.tolist() == [Months.TEVET, Months.TISHREI]
+    assert days.tolist() == [5, 1]
+    ordinals = conv.hebrew_to_gdates(years, months, days)
+    assert (ordinals - conv.UNIX_EPOCH_ORDINAL).astype("datetime64[D]").tolist() == [
+        dt.date(2025, 1, 5),
+        dt.date(2024, 10, 3),
+    ]
+
+
+@pytest.mark.parametrize(
+    "year,month,day",
+    [
+        (5785, Months.ELUL, 45),
+        (5785, Months.ELUL, 0),
+        (5785, 20, 1),
+        (5785, Months.ADAR_I, 1),
+        (5784, Months.ADAR, 1),
+        (5784, Months.KISLEV, 30),
+    ],
+)
+def test_batch_invalid_hebrew_dates(year: int, month: int, day: int) -> None:
+    """Batch conversion rejects the dates which don't exist."""
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        conv.hebrew_to_gdates([5786, year], [Months.TISHREI, month], [1, day])
+
+
+@pytest.mark.parametrize(
+    "dates",
+    [
+        [dt.date(2025, 1, 5).toordinal(), 0],
+        [-100],
+        [dt.date.max.toordinal() + 1],
+    ],
+)
+def test_batch_invalid_ordinals(dates: list[int]) -> None:
+    """Batch conversion rejects the ordinals outside the range of datetime.date."""
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        conv.gdates_to_hebrew(np.array(dates, dtype=np.int64))
+
+
+def test_batch_nat() -> None:
+    """Batch conversion rejects NaT."""
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        conv.gdates_to_hebrew(np.array(["2025-01-05", "NaT"], dtype="datetime64[D]"))
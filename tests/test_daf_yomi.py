@@ -1,10 +1,18 @@
 """Tests for the Daf Yomi attribute."""
 
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+from hypothesis import given, settings, strategies
 
 from hdate import HDateInfo
+from hdate.daf_yomi import (
+    YERUSHALMI_YOMI_MESECHTOS,
+    DafYomiDatabase,
+    Masechta,
+    YerushalmiYomiDatabase,
+)
 from hdate.translator import Language, set_language
 
 
@@ -22,3 +30,100 @@ def test_daf_yomi(language: Language, date: dt.date, expected: str) -> None:
     """Test value of Daf Yomi."""
     set_language(language)
     assert HDateInfo(date=date).daf_yomi == expected
+
+
+@given(
+    start=strategies.dates(dt.date(1997, 9, 29), dt.date(2100, 1, 1)),
+    days=strategies.integers(min_value=0, max_value=3000),
+)
+def test_lookup_range(start: dt.date, days: int) -> None:
+    """Looking up a range of days matches looking up each day."""
+    db = DafYomiDatabase()
+    end = start + dt.timedelta(days=days)
+    result = list(db.lookup_range(start, end))
+    assert [date for date, _ in result] == [
+        start + dt.timedelta(days=day) for day in range(days)
+    ]
+    assert all(daf == db.lookup(date) for date, daf in result)
+
+
+def test_date_of() -> None:
+    """Find the date a daf is learnt."""
+    db = DafYomiDatabase()
+    assert db.date_of("berachos", 2, cycle=14) == dt.date(2020, 1, 5)
+    assert db.date_of("niddah", 73, cycle=13) == dt.date(2020, 1, 4)
+    date = db.date_of("bava_basra", 100)
+    assert dt.date.today() <= date < dt.date.today() + dt.timedelta(days=2711)
+    assert db.lookup(date) == Masechta("bava_basra", 100)
+    with pytest.raises(ValueError, match="Unknown masechta"):
+        db.date_of("bava_basra_ii", 2)
+    with pytest.raises(ValueError, match="not in"):
+        db.date_of("horayos", 15)
+    with pytest.raises(ValueError, match="not supported"):
+        db.cycle_start(10)
+
+
+def test_cycle_calendar() -> None:
+    """The calendar of a cycle lists the daf learnt on each of its days."""
+    db = DafYomiDatabase()
+    cycle = db.cycle_calendar(14)
+    assert len(cycle) == db.cycle_length()
+    assert cycle.date(0) == dt.date(2020, 1, 5)
+    expected = db.lookup_range(cycle.date(0), db.cycle_start(15))
+    for day, (date, daf) in enumerate(expected):
+        assert cycle.date(day) == date
+        assert cycle[day] == daf
+
+
+@given(
+    start=strategies.dates(dt.date(1980, 2, 2), dt.date(2100, 1, 1)),
+    days=strategies.integers(min_value=0, max_value=1000),
+)
+@settings(deadline=None)
+def test_yerushalmi_lookup_range(start: dt.date, days: int) -> None:
+    """The Yerushalmi schedule skips Yom Kippur and Tisha B'Av."""
+    db = YerushalmiYomiDatabase()
+    end = start + dt.timedelta(days=days)
+    result = dict(db.lookup_range(start, end))
+    for day in range(days):
+        date = start + dt.timedelta(days=day)
+        holidays = {h.name for h in HDateInfo(date).holidays}
+        skipped = bool(holidays & {"yom_kippur", "tisha_bav"})
+        assert db.lookup(date) == (None if skipped else result[date])
+        assert skipped != (date in result)
+
+
+@pytest.mark.parametrize(
+    ("masechta", "daf"), [("berachos", 1), ("bava_basra", 34), ("niddah", 13)]
+)
+@pytest.mark.parametrize("cycle", [1, 5, 10])
+def test_yerushalmi_date_of(masechta: str, daf: int, cycle: int) -> None:
+    """Find the date a daf of Yerushalmi is learnt."""
+    db = YerushalmiYomiDatabase()
+    date = db.date_of(masechta, daf, cycle)
+    assert db.lookup(date) == Masechta(masechta, daf)
+    assert db.cycle_start(cycle) <= date < db.cycle_start(cycle + 1)
+
+
+def test_yerushalmi_cycle_calendar() -> None:
+    """The calendar of a cycle lists the daf learnt on each of its learning days."""
+    db = YerushalmiYomiDatabase()
+    cycle = db.cycle_calendar(6)
+    assert len(cycle) == db.cycle_length() == 1554
+    expected = db.lookup_range(db.cycle_start(6), db.cycle_start(7))
+    for day, (date, daf) in enumerate(expected):
+        assert cycle.date(day) == date
+        assert cycle[day] == daf
+    with pytest.raises(ValueError, match="starts on"):
+        db.lookup(dt.date(1980, 1, 1))
+
+
+def test_yerushalmi_concurrent_lookups() -> None:
+    """Lookups from several threads agree while the skipped dates are extended."""
+    dates = [dt.date(1980 + 7 * i, 8, 1) for i in range(40)]
+    expected = [YerushalmiYomiDatabase().lookup(date) for date in dates]
+    # Start over from the start date, so that the threads extend the skipped dates
+    YerushalmiYomiDatabase.register(list(YERUSHALMI_YOMI_MESECHTOS))
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(YerushalmiYomiDatabase().lookup, dates))
+    assert results == expected
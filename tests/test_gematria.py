@@ -44,3 +44,36 @@ def test_hebrew_number_hebrew_false(number: int) -> None:
     set_language("en")
     assert gematria.hebrew_number(number) == str(number)
     assert gematria.hebrew_number(number, short=True) == str(number)
+
+
+@pytest.mark.parametrize("short", [True, False])
+def test_hebrew_numbers(short: bool) -> None:
+    """The batch formatting matches formatting each number."""
+    numbers = [number for number, *_ in NUMBERS]
+    expected = [gematria.hebrew_number(number, short=short) for number in numbers]
+    assert gematria.hebrew_numbers(numbers, short=short) == expected
+    assert gematria.hebrew_numbers(numbers, short=short, language="en") == [
+        str(number) for number in numbers
+    ]
+
+
+@given(
+    number=strategies.integers(min_value=1, max_value=9999), short=strategies.booleans()
+)
+def test_parse_hebrew_number(number: int, short: bool) -> None:
+    """Parsing a hebrew number gives back its value."""
+    text = gematria.hebrew_number(number, short=short, language="he")
+    assert gematria.parse_hebrew_number(text) == number
+
+
+def test_parse_hebrew_punctuation() -> None:
+    """The hebrew geresh and gershayim are accepted."""
+    assert gematria.parse_hebrew_number("תשפ״ה") == 785
+    assert gematria.parse_hebrew_number("ה׳") == 5
+
+
+@pytest.mark.parametrize("text", ["", "'", "abc", "יה", 'ת"ת"ת'])
+def test_parse_invalid_hebrew_number(text: str) -> None:
+    """Texts which aren't hebrew numbers are rejected."""
+    with pytest.raises(ValueError):
+        gematria.parse_hebrew_number(text)
@@ -4,6 +4,7 @@ maybe other apps in the future).
 """
 
 import datetime as dt
+import subprocess
 import sys
 from typing import cast
 
@@ -11,7 +12,9 @@ import pytest
 from _pytest.capture import CaptureFixture
 from syrupy.assertion import SnapshotAssertion
 
+import hdate as hdate_package
 from hdate import HDateInfo, Location, Zmanim
+from hdate.holidays import HolidayTypes
 from hdate.translator import Language, set_language
 
 _ASTRAL = "astral" in sys.modules
@@ -195,3 +198,36 @@ class TestZmanimAPI:
         assert not zman.issur_melacha_in_effect(
             dt.datetime(2019, 4, 21, 20, 30, tzinfo=_timezone)
         )
+
+
+def test_lazy_exports() -> None:
+    """Importing the package only imports the date conversion."""
+    code = (
+        "import sys, hdate; "
+        "print(sorted(m for m in sys.modules if m.startswith('hdate.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    modules = result.stdout.strip()
+    for module in ("date_info", "holidays", "parasha", "daf_yomi", "zmanim"):
+        assert f"'hdate.{module}'" not in modules
+    assert "'hdate.hebrew_date'" in modules
+
+
+def test_lazy_exports_resolve() -> None:
+    """The lazy exports resolve to the classes of their modules."""
+    assert hdate_package.HDateInfo is HDateInfo
+    assert hdate_package.HolidayTypes is HolidayTypes
+    assert set(hdate_package.__all__) <= set(dir(hdate_package))
+    with pytest.raises(AttributeError):
+        getattr(hdate_package, "NotAnExport")
+
+
+def test_lazy_submodules() -> None:
+    """The submodules are available as attributes of the package."""
+    code = "import hdate; print(hdate.zmanim.Zmanim.__name__, hdate.parasha.__name__)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    assert result.stdout.split() == ["Zmanim", "hdate.parasha"]
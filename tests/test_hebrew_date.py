@@ -14,6 +14,7 @@ from hdate.hebrew_date import (
     Months,
     is_leap_year,
     is_shabbat,
+    year_layout,
 )
 from tests.conftest import valid_hebrew_date
 
@@ -175,6 +176,17 @@ def test_hebrew_date_addition(d1: HebrewDate, days: int) -> None:
     assert d2 + negative_delta == d1
 
 
+@given(
+    d1=valid_hebrew_date(),
+    days=strategies.integers(min_value=-50_000, max_value=50_000),
+)
+def test_hebrew_date_add_days(d1: HebrewDate, days: int) -> None:
+    """Test that adding days to a HebrewDate matches the Gregorian calendar."""
+    d2 = d1.add_days(days)
+    assert d2 == d1 + dt.timedelta(days=days)
+    assert d2.to_gdate() == d1.to_gdate() + dt.timedelta(days=days)
+
+
 @pytest.mark.xfail(reason="Will fail if relative date does not exist in current year.")
 @given(d1=valid_hebrew_date(), d2=relative_hebrew_date())
 @example(d2=HebrewDate(0, Months.MARCHESHVAN, 30))
@@ -184,6 +196,45 @@ def test_hebrew_date_addition_with_no_year(d1: HebrewDate, d2: HebrewDate) -> No
     assert d1 + diff == d2
 
 
+@pytest.mark.parametrize(
+    "start, days, expected",
+    [
+        (HebrewDate(0, Months.ADAR, 14), 0, HebrewDate(0, Months.ADAR, 14)),
+        (HebrewDate(0, Months.ADAR, 1), -40, HebrewDate(0, Months.TEVET, 20)),
+        (HebrewDate(0, Months.ADAR, 29), 1, HebrewDate(0, Months.NISAN, 1)),
+        (HebrewDate(0, Months.ADAR_I, 30), 1, HebrewDate(0, Months.ADAR_II, 1)),
+        (HebrewDate(0, Months.ADAR_II, 1), -1, HebrewDate(0, Months.ADAR_I, 30)),
+    ],
+)
+def test_adar_addition_with_no_year(
+    start: HebrewDate, days: int, expected: HebrewDate
+) -> None:
+    """Test that adding days to a yearless Adar keeps to the months it walks."""
+    assert start + dt.timedelta(days=days) == expected
+    assert start.add_days(days) == expected
+
+
+@given(date=valid_hebrew_date())
+def test_to_jdn_matches_month_walk(date: HebrewDate) -> None:
+    """Test that the year layout agrees with walking the months from Tishrei."""
+    days = sum(
+        month.days(date.year)
+        for month in Months.in_year(date.year)
+        if month.compare(date.month) < 0
+    )
+    rosh_hashana = HebrewDate(date.year, Months.TISHREI, 1)
+    assert date.to_jdn() == rosh_hashana.to_jdn() + days + date.day - 1
+
+
+@given(strategies.integers(min_value=MIN_YEAR, max_value=MAX_YEAR))
+def test_year_layout(year: int) -> None:
+    """Test that consecutive year layouts line up."""
+    layout = year_layout(year)
+    assert layout.length == HebrewDate.year_size(year)
+    assert layout.rosh_hashana + layout.length == year_layout(year + 1).rosh_hashana
+    assert layout.months == tuple(Months.in_year(year))
+
+
 def test_to_jdn_snapshot(snapshot: SnapshotAssertion) -> None:
     """Test the to_jdn method."""
     assert HebrewDate(5785, Months.TEVET, 5).to_jdn() == snapshot
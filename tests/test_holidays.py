@@ -4,13 +4,31 @@ import datetime as dt
 import random
 import typing
 from collections import defaultdict
+from dataclasses import dataclass
 
 import pytest
 from hypothesis import given, settings, strategies
 
 from hdate import HDateInfo, HebrewDate
-from hdate.hebrew_date import Months
-from hdate.holidays import HolidayDatabase, is_yom_tov
+from hdate.hebrew_date import LAST_GREGORIAN_DATE, Months, Weekday, year_layout
+from hdate.holiday_rules import (
+    DateRule,
+    kislev_is_short,
+    not_on_dow,
+    only_on_dow,
+    shifted,
+    year_is_after,
+    year_is_before,
+)
+from hdate.holidays import (
+    Holiday,
+    HolidayDatabase,
+    HolidayRegistry,
+    HolidayTypes,
+    holidays_mask,
+    is_yom_tov,
+    types_mask,
+)
 from hdate.translator import Language, set_language
 from tests.conftest import valid_hebrew_date
 
@@ -370,3 +388,300 @@ def test_new_holidays_known_dates(
     assert len(holidays) == int(is_holiday)
     if holidays:
         assert holidays[0].name == expected
+
+
+@pytest.mark.parametrize("diaspora", [True, False])
+def test_databases_share_holidays(diaspora: bool) -> None:
+    """Databases with the same diaspora setting share a single read-only index."""
+    first = HolidayDatabase(diaspora)
+    second = HolidayDatabase(diaspora)
+    # pylint: disable=protected-access
+    assert first._instance_holidays is second._instance_holidays
+    assert (
+        first._instance_holidays is not HolidayDatabase(not diaspora)._instance_holidays
+    )
+    with pytest.raises(TypeError):
+        first._instance_holidays[HebrewDate()] = ()  # type: ignore[index]
+
+
+@pytest.mark.parametrize("diaspora", [True, False])
+@given(date=valid_hebrew_date())
+def test_lookup_with_types(date: HebrewDate, diaspora: bool) -> None:
+    """Filtering by types gives the same holidays as filtering the full lookup."""
+    holiday_db = HolidayDatabase(diaspora)
+    types = [HolidayTypes.YOM_TOV, HolidayTypes.FAST_DAY]
+    expected = [h for h in holiday_db.lookup(date) if h.type in types]
+    assert holiday_db.lookup(date, types) == expected
+    assert holiday_db.lookup(date, list(reversed(types))) == expected
+
+
+@pytest.mark.parametrize("diaspora", [True, False])
+@given(date=valid_hebrew_date())
+def test_lookup_matches_rules(date: HebrewDate, diaspora: bool) -> None:
+    """The materialized calendars give the same holidays as evaluating the rules."""
+    holiday_db = HolidayDatabase(diaspora)
+    # pylint: disable=protected-access
+    candidates = holiday_db._instance_holidays.get(HebrewDate(0, date.month, date.day))
+    expected = [
+        holiday
+        for holiday in candidates or ()
+        if all(func(date) for func in holiday.date_functions_list)
+    ]
+    assert holiday_db.lookup(date) == expected
+    assert holiday_db.lookup_holidays_for_year(date).get(date, []) == expected
+
+
+@pytest.mark.parametrize("diaspora", [True, False])
+@given(date=valid_hebrew_date())
+@settings(deadline=None)
+def test_next_and_previous_holidays(date: HebrewDate, diaspora: bool) -> None:
+    """The next and previous holidays match a day by day lookup, across years."""
+    holiday_db = HolidayDatabase(diaspora)
+    types = [HolidayTypes.YOM_TOV, HolidayTypes.FAST_DAY]
+    upcoming = holiday_db.lookup_next_holidays(date, types, count=5)
+    past = holiday_db.lookup_previous_holidays(date, types, count=5)
+    assert len(upcoming) == len(past) == 5
+    assert list(upcoming) == sorted(upcoming)
+    assert list(past) == sorted(past, reverse=True)
+    assert holiday_db.lookup_next_holiday(date, types) == next(iter(upcoming))
+    assert holiday_db.lookup_previous_holiday(date, types) == next(iter(past))
+
+    cur_date = date
+    for _ in range(2):
+        while not (holidays := holiday_db.lookup(cur_date, types)):
+            cur_date += dt.timedelta(days=1)
+        assert upcoming[cur_date] == holidays
+        cur_date += dt.timedelta(days=1)
+    cur_date = date
+    while not (holidays := holiday_db.lookup(cur_date, types)):
+        cur_date += dt.timedelta(days=-1)
+    assert past[cur_date] == holidays
+
+
+def test_next_holiday_rolls_over_year() -> None:
+    """The search for the next holiday continues into the next year."""
+    holiday_db = HolidayDatabase(diaspora=False)
+    date = HebrewDate(5785, Months.ELUL, 1)
+    assert holiday_db.lookup_next_holiday(date, HolidayTypes.FAST_DAY) == HebrewDate(
+        5786, Months.TISHREI, 3
+    )
+    assert holiday_db.lookup_previous_holiday(
+        HebrewDate(5785, Months.TISHREI, 2), HolidayTypes.FAST_DAY
+    ) == HebrewDate(5784, Months.AV, 9)
+
+
+@pytest.mark.parametrize("diaspora", [True, False])
+def test_iter_range(diaspora: bool) -> None:
+    """Iterating over a range matches the holidays of each year in it."""
+    holiday_db = HolidayDatabase(diaspora)
+    start, end = HebrewDate(5780, Months.TISHREI, 1), HebrewDate(
+        5790, Months.TISHREI, 1
+    )
+    expected = {}
+    for year in range(start.year, end.year):
+        expected.update(holiday_db.lookup_holidays_for_year(HebrewDate(year)))
+    assert dict(holiday_db.iter_range(start, end)) == expected
+
+    gregorian = holiday_db.iter_range(start.to_gdate(), end, types=HolidayTypes.YOM_TOV)
+    first_date, holidays = next(gregorian)
+    assert first_date == start.to_gdate()
+    assert [holiday.name for holiday in holidays] == ["rosh_hashana_i"]
+    assert all(date < end.to_gdate() for date, _ in gregorian)
+
+
+RULES = [
+    not_on_dow([Weekday.SATURDAY, Weekday.FRIDAY]),
+    only_on_dow(Weekday.SUNDAY),
+    year_is_after(5708),
+    year_is_before(5710),
+    kislev_is_short(),
+    shifted(only_on_dow(Weekday.SATURDAY), -1),
+    shifted(year_is_after(5708), 3),
+]
+
+
+@pytest.mark.parametrize("rule", RULES)
+@given(year=strategies.integers(min_value=5700, max_value=5800))
+def test_rule_for_whole_year(rule: DateRule, year: int) -> None:
+    """Evaluating a rule for a whole year matches evaluating it per date."""
+    first_day = HebrewDate(year)
+    dates = [
+        first_day + dt.timedelta(days=day) for day in range(HebrewDate.year_size(year))
+    ]
+    expected = [rule(date) for date in dates]
+    assert rule.matches(dates) == expected
+    assert rule.days(year) == {day for day, holds in enumerate(expected) if holds}
+
+
+def test_rules_are_data() -> None:
+    """Rules can be compared, hashed and introspected."""
+    assert only_on_dow(Weekday.SUNDAY) == only_on_dow(Weekday.SUNDAY)
+    assert len({year_is_after(5708), year_is_after(5708)}) == 1
+    assert year_is_after(5708).cutoffs == (5709,)
+    assert shifted(year_is_before(5710), 1).cutoffs == (5709, 5710, 5711)
+
+
+@dataclass(frozen=True)
+class EvenYear(DateRule):
+    """Holds in even years, which doesn't only depend on the type of the year."""
+
+    def __call__(self, date: HebrewDate) -> bool:
+        return date.year % 2 == 0
+
+
+def test_custom_rules_not_materialized() -> None:
+    """Rules which don't opt in are evaluated for each year."""
+    assert not EvenYear().materializable
+    even_years = Holiday(
+        HolidayTypes.MEMORIAL_DAY, "even_years", (Months.SHVAT, 3), [EvenYear()]
+    )
+    holiday_db = HolidayDatabase(diaspora=False).with_holidays([even_years])
+    for year in range(5783, 5799):
+        holidays = holiday_db.lookup(HebrewDate(year, Months.SHVAT, 3))
+        assert (even_years in holidays) == (year % 2 == 0)
+    assert [date.year for date in holiday_db.occurrences("even_years", 5783, 5789)] == [
+        5784,
+        5786,
+        5788,
+    ]
+
+
+@pytest.mark.parametrize("diaspora", [True, False])
+@given(date=valid_hebrew_date())
+def test_day_masks(date: HebrewDate, diaspora: bool) -> None:
+    """The day masks hold the types of the holidays on each day."""
+    holiday_db = HolidayDatabase(diaspora)
+    layout_day = (date - HebrewDate(date.year)).days
+    holidays = holiday_db.lookup(date)
+    expected = {holiday.type for holiday in holidays}
+    assert holiday_db.day_masks(date.year)[layout_day] == holidays_mask(holidays)
+    assert holidays_mask(holidays) == (types_mask(list(expected)) if expected else 0)
+    for _type in HolidayTypes:
+        assert holiday_db.is_holiday(date, _type) == (_type in expected)
+    assert holiday_db.is_holiday(date, []) == bool(holiday_db.lookup(date, []))
+    assert holiday_db.is_holiday(date, []) == holiday_db.is_holiday(date)
+
+
+@pytest.mark.parametrize("diaspora", [True, False])
+@given(
+    start=strategies.dates(dt.date(1900, 1, 1), dt.date(2100, 1, 1)),
+    days=strategies.integers(min_value=0, max_value=1000),
+)
+def test_any_holiday(start: dt.date, days: int, diaspora: bool) -> None:
+    """Checking a range for holidays matches iterating over it."""
+    holiday_db = HolidayDatabase(diaspora)
+    end = start + dt.timedelta(days=days)
+    for types in (None, HolidayTypes.YOM_TOV, [HolidayTypes.FAST_DAY]):
+        expected = any(True for _ in holiday_db.iter_range(start, end, types))
+        assert holiday_db.any_holiday(start, end, types) == expected
+
+
+@pytest.mark.parametrize("diaspora", [True, False])
+@pytest.mark.parametrize("name", ["chanukah", "tisha_bav", "yom_haatzmaut"])
+def test_occurrences(name: str, diaspora: bool) -> None:
+    """The occurrences of a holiday match the holidays of each year."""
+    holiday_db = HolidayDatabase(diaspora)
+    expected = [
+        date
+        for year in range(5700, 5800)
+        for date, holidays in holiday_db.lookup_holidays_for_year(
+            HebrewDate(year)
+        ).items()
+        if any(holiday.name == name for holiday in holidays)
+    ]
+    assert holiday_db.occurrences(name, 5700, 5800) == expected
+
+
+def test_occurrences_unknown_holiday() -> None:
+    """Looking up an unknown holiday raises an error."""
+    with pytest.raises(ValueError, match="Unknown holiday"):
+        HolidayDatabase(diaspora=False).occurrences("festivus", 5700, 5800)
+
+
+def test_with_holidays() -> None:
+    """Adding holidays to a database doesn't affect the other databases."""
+    memorial = Holiday(HolidayTypes.MEMORIAL_DAY, "founder_memorial", (Months.SHVAT, 3))
+    fast = Holiday(
+        HolidayTypes.FAST_DAY,
+        "community_fast",
+        (Months.SHVAT, (3, 4, 5)),
+        [not_on_dow([Weekday.MONDAY])],
+        "DIASPORA",
+    )
+    holiday_db = HolidayDatabase(diaspora=True)
+    custom_db = holiday_db.with_holidays([memorial, fast])
+    date = HebrewDate(5785, Months.SHVAT, 3)
+
+    assert custom_db.lookup(date) == [memorial, fast]
+    assert custom_db.with_holidays([]).lookup(date) == [memorial, fast]
+    assert custom_db.occurrences("community_fast", 5785, 5786) == [
+        date,
+        HebrewDate(5785, Months.SHVAT, 4),
+    ]
+    assert holiday_db.lookup(date) == []
+    assert HolidayDatabase(diaspora=True).lookup(date) == []
+    assert HolidayDatabase(diaspora=False, registry=custom_db.registry).lookup(
+        date
+    ) == [memorial]
+
+
+@pytest.mark.parametrize("diaspora", [True, False])
+@given(date=valid_hebrew_date())
+def test_with_holidays_incremental(date: HebrewDate, diaspora: bool) -> None:
+    """Extended databases find the same holidays as a database built at once."""
+    added = [
+        Holiday(
+            HolidayTypes.MEMORIAL_DAY,
+            "founder_memorial",
+            (Months.SHVAT, 3),
+            israel_diaspora="DIASPORA",
+        ),
+        Holiday(
+            HolidayTypes.FAST_DAY,
+            "late_fast",
+            (Months.TISHREI, (3, 4)),
+            [shifted(year_is_after(5780), 1), EvenYear()],
+        ),
+        Holiday(HolidayTypes.MINOR_HOLIDAY, "second_purim", (Months.ADAR, 14)),
+    ]
+    holiday_db = HolidayDatabase(diaspora)
+    extended = holiday_db.with_holidays(added[:1]).with_holidays(added[1:])
+    # pylint: disable-next=protected-access
+    registry = HolidayRegistry._add(holiday_db.registry, added)
+    expected = HolidayDatabase(diaspora, registry)
+
+    def names(holidays: list[Holiday]) -> list[str]:
+        return sorted(holiday.name for holiday in holidays)
+
+    assert names(extended.lookup(date)) == names(expected.lookup(date))
+    assert extended.lookup_next_holiday(date) == expected.lookup_next_holiday(date)
+    assert extended.occurrences("late_fast", date.year, date.year + 3) == (
+        expected.occurrences("late_fast", date.year, date.year + 3)
+    )
+
+
+def test_with_holidays_reuses_calendars() -> None:
+    """Extending a database reuses its calendars instead of rebuilding them."""
+    holiday_db = HolidayDatabase(diaspora=False)
+    memorial = Holiday(HolidayTypes.MEMORIAL_DAY, "founder_memorial", (Months.SHVAT, 3))
+    extended = holiday_db.with_holidays([memorial])
+    base_index = holiday_db.registry.index(False, None)
+    index = extended.registry.index(False, None)
+    assert index._base is base_index  # pylint: disable=protected-access
+    day = year_layout(5785).day_of_year(Months.SHVAT, 3)
+    calendar, base_calendar = index.calendar(5785), base_index.calendar(5785)
+    assert calendar.days[day] == base_calendar.days[day] + (memorial,)
+    assert calendar.days[:day] == base_calendar.days[:day]
+    assert calendar.days[day + 1 :] == base_calendar.days[day + 1 :]
+
+
+def test_iter_range_last_gregorian_date() -> None:
+    """Gregorian ranges stop at the last date which can be converted."""
+    holiday_db = HolidayDatabase(diaspora=False)
+    end = LAST_GREGORIAN_DATE + dt.timedelta(days=60)
+    gregorian = list(holiday_db.iter_range(dt.date(9999, 12, 1), end))
+    assert gregorian[-1][0] <= dt.date.max
+    hebrew = list(
+        holiday_db.iter_range(HebrewDate.from_gdate(dt.date(9999, 12, 1)), end)
+    )
+    assert len(hebrew) > len(gregorian)
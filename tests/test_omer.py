@@ -1,6 +1,8 @@
 """Tests relating to Sefirat HaOmer."""
 
 import datetime as dt
+import subprocess
+import sys
 import typing
 
 import pytest
@@ -115,3 +117,34 @@ def test_omer_dont_change_language() -> None:
     date = HebrewDate(5785, Months.NISAN, 16)
     assert str(omer) == 'כ"ה לעומר'
     assert str(date) == 'ט"ז ניסן ה\' תשפ"ה'
+
+
+def test_count_str_cached_per_language() -> None:
+    """The cached counting texts follow the current language."""
+    omer = Omer(total_days=25)
+    set_language("en")
+    english = omer.count_str()
+    set_language("he")
+    assert omer.count_str() != english
+    set_language("en")
+    assert omer.count_str() == english
+
+
+@pytest.mark.parametrize("nusach", list(Nusach))
+def test_count_str_in_cached_language(nusach: Nusach) -> None:
+    """The cached counting text is rendered in the language of its cache key."""
+    # pylint: disable=protected-access
+    Omer._count_str.cache_clear()
+    english = Omer._count_str(25, nusach, "en")
+    set_language("en")
+    Omer._count_str.cache_clear()
+    assert Omer(total_days=25, nusach=nusach).count_str() == english
+
+
+def test_num2words_imported_lazily() -> None:
+    """Importing the package doesn't import num2words."""
+    code = "import sys, hdate; print('num2words' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    assert result.stdout.strip() == "False"
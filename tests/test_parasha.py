@@ -8,8 +8,8 @@ from hypothesis import given, settings, strategies
 from syrupy.assertion import SnapshotAssertion
 
 from hdate import HDateInfo, HebrewDate
-from hdate.hebrew_date import Months
-from hdate.parasha import Parasha, ParashaDatabase, erange
+from hdate.hebrew_date import LAST_GREGORIAN_DATE, Months, Weekday
+from hdate.parasha import PARASHA_SEQUENCES, Parasha, ParashaDatabase, erange
 
 YEAR_TYPES = [
     # שנים מעוברות
@@ -124,3 +124,82 @@ def test_erange(_from: Enum, _to: Enum, _expected: list[Enum] | None) -> None:
             erange(_from, _to)
         return
     assert erange(_from, _to) == _expected
+
+
+@pytest.mark.parametrize("year", YEAR_TYPES)
+@pytest.mark.parametrize("diaspora", [True, False])
+def test_year_readings(diaspora: bool, year: int) -> None:
+    """The readings of a year are the ones registered for its year type."""
+    readings = ParashaDatabase.year_readings(year, diaspora)
+    rosh_hashana = HebrewDate(year, Months.TISHREI, 1)
+    pesach = HebrewDate(year, Months.NISAN, 15)
+    year_type = (
+        diaspora * 1000
+        + rosh_hashana.dow() * 100
+        + (HebrewDate.year_size(year) % 10 - 3) * 10
+        + pesach.dow()
+    )
+    assert readings.rosh_hashana == rosh_hashana.to_jdn()
+    assert readings.weekday == rosh_hashana.dow()
+    assert readings.readings == next(
+        seq for types, seq in PARASHA_SEQUENCES.items() if year_type in types
+    )
+    assert ParashaDatabase.year_readings(year, diaspora) is readings
+
+
+@pytest.mark.parametrize("diaspora", [True, False])
+@given(year=strategies.integers(min_value=4000, max_value=6000))
+@settings(deadline=None)
+def test_schedule(year: int, diaspora: bool) -> None:
+    """The schedule of a year lists the reading of each of its Shabbatot."""
+    db = ParashaDatabase(diaspora)
+    schedule = db.schedule(year)
+    rosh_hashana = HebrewDate(year, Months.TISHREI, 1)
+    first_shabbat = rosh_hashana + dt.timedelta(days=7 - rosh_hashana.dow())
+    assert schedule[0][0] == first_shabbat
+    assert len(schedule) in (50, 51, 54, 55)
+    for shabbat, parasha in schedule:
+        assert shabbat.year == year
+        assert shabbat.dow() == Weekday.SATURDAY
+        assert db.lookup(shabbat) == parasha
+
+
+@pytest.mark.parametrize("diaspora", [True, False])
+@given(
+    date=strategies.dates(dt.date(1900, 1, 1), dt.date(2100, 1, 1)),
+    parasha=strategies.sampled_from(
+        [Parasha.BERESHIT, Parasha.TAZRIA_METZORA, Parasha.MATOT_MASEI]
+    ),
+)
+@settings(deadline=None)
+def test_next_reading(date: dt.date, parasha: Parasha, diaspora: bool) -> None:
+    """The next readings of a parasha match a Shabbat by Shabbat lookup."""
+    db = ParashaDatabase(diaspora)
+    readings = db.next_reading(parasha, date, count=2)
+    expected: list[dt.date] = []
+    shabbat = date + dt.timedelta(days=(5 - date.weekday()) % 7 or 7)
+    while len(expected) < 2:
+        if db.lookup(HebrewDate.from_gdate(shabbat)) == parasha:
+            expected.append(shabbat)
+        shabbat += dt.timedelta(days=7)
+    assert readings == expected
+    hebrew_date = HebrewDate.from_gdate(date)
+    assert db.next_reading(parasha, hebrew_date, count=2) == [
+        HebrewDate.from_gdate(reading) for reading in expected
+    ]
+
+
+def test_next_reading_never_read() -> None:
+    """A parasha never read on Shabbat has no next reading."""
+    date = dt.date(2025, 1, 1)
+    assert ParashaDatabase(True).next_reading(Parasha.VEZOT_HABRACHA, date) == []
+    assert ParashaDatabase(False).next_reading(Parasha.CHUKAT_BALAK, date) == []
+
+
+def test_next_reading_after_last_gregorian_date() -> None:
+    """Readings after the last Gregorian date are only returned as Hebrew dates."""
+    db = ParashaDatabase(False)
+    after = dt.date(9999, 1, 1)
+    readings = db.next_reading(Parasha.TOLDOT, HebrewDate.from_gdate(after), count=2)
+    assert readings and all(reading > LAST_GREGORIAN_DATE for reading in readings)
+    assert db.next_reading(Parasha.TOLDOT, after, count=2) == []
@@ -1,10 +1,13 @@
 """Tests for the TranslatorMixin class."""
 
+import subprocess
+import sys
 import typing
 
 import pytest
 
-from hdate.hebrew_date import Months
+from hdate.date_info import HDateInfo
+from hdate.hebrew_date import HebrewDate, Months
 from hdate.translator import Language, TranslatorMixin, get_language, set_language
 
 
@@ -45,3 +48,45 @@ def test_translation_not_found(caplog: pytest.LogCaptureFixture) -> None:
     assert "Translation for non-existing-key not found" in caplog.text
     with pytest.raises(NameError):
         str(foo_class)
+
+
+def test_languages_loaded_lazily() -> None:
+    """Only the translations of the languages in use are loaded."""
+    code = (
+        "from hdate import Months; from hdate.translator import _load_language; "
+        "from hdate.translator import set_language; set_language('fr'); "
+        "str(Months.TISHREI); print(_load_language.cache_info().currsize)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    assert result.stdout.strip() == "1"
+
+
+@pytest.mark.parametrize("language", typing.get_args(Language))
+def test_class_translations_are_shared(language: Language) -> None:
+    """The translations of a class are computed once per language."""
+    set_language(language)
+    assert Months.TISHREI.translations is Months.NISAN.translations
+    assert Months.TISHREI.translations["tishrei"] == str(Months.TISHREI)
+
+
+@pytest.mark.parametrize("language", typing.get_args(Language))
+def test_format_language(language: Language) -> None:
+    """Formatting in a language doesn't depend on the current language."""
+    set_language(language)
+    expected = {"en": "Tishrei", "fr": "Tishri", "he": "תשרי"}
+    for other in typing.get_args(Language):
+        assert Months.TISHREI.format(other) == expected[other]
+    assert str(Months.TISHREI) == expected[language]
+    assert get_language() == language
+
+
+@pytest.mark.parametrize("language", typing.get_args(Language))
+def test_format_matches_str(language: Language) -> None:
+    """Formatting composite objects matches their string in that language."""
+    info = HDateInfo(HebrewDate(5785, Months.NISAN, 20))
+    date = HebrewDate(5785, Months.ADAR, 14)
+    formatted = (info.format(language), date.format(language))
+    set_language(language)
+    assert formatted == (str(info), str(date))
@@ -0,0 +1,64 @@
+"""Tests for the precomputed year table."""
+
+import pathlib
+from typing import Iterator
+
+import pytest
+from hypothesis import given, strategies
+
+from hdate import year_table
+from hdate.hebrew_date import HebrewDate, Months, is_leap_year, year_layout
+from hdate.parasha import Parasha, ParashaDatabase
+
+TABLE = year_table.YearTable.build(5000, 6000)
+
+
+@pytest.fixture(name="installed_table")
+def fixture_installed_table(tmp_path: pathlib.Path) -> Iterator[year_table.YearTable]:
+    """Generate a table file, memory map it and use it for the calculations."""
+    path = tmp_path / "years.bin"
+    year_table.generate(path, 5700, 5800)
+    table = year_table.load(path)
+    year_table.install(table)
+    try:
+        yield table
+    finally:
+        year_table.install(None)
+
+
+@given(year=strategies.integers(min_value=5000, max_value=6000))
+def test_table_matches_calculation(year: int) -> None:
+    """The records in the table match the molad calculation."""
+    record = TABLE.record(year)
+    rosh_hashana = HebrewDate(year, Months.TISHREI, 1)
+    assert record.rosh_hashana == rosh_hashana.to_jdn()
+    assert record.length == HebrewDate.year_size(year)
+    assert record.weekday == rosh_hashana.dow()
+    assert record.leap == is_leap_year(year)
+
+
+def test_year_out_of_table() -> None:
+    """Years outside of the table raise a KeyError."""
+    assert 4999 not in TABLE
+    with pytest.raises(KeyError):
+        TABLE.record(4999)
+
+
+def test_invalid_buffer() -> None:
+    """A buffer which isn't a year table is rejected."""
+    with pytest.raises(ValueError):
+        year_table.YearTable.from_buffer(b"HDYT" + bytes(20))
+
+
+def test_installed_table(installed_table: year_table.YearTable) -> None:
+    """Conversions give the same results when using the table."""
+    assert installed_table.first_year == 5700
+    assert installed_table.last_year == 5800
+    assert year_layout(5785).rosh_hashana == installed_table.rosh_hashana(5785)
+    date = HebrewDate(5785, Months.TEVET, 5)
+    assert date.to_jdn() == 2460681
+    assert HebrewDate.from_jdn(2460681) == date
+    # Years outside the table are still calculated
+    assert HebrewDate(5900, Months.NISAN, 15).to_gdate().year == 2140
+    simchat_torah = HebrewDate(5785, Months.TISHREI, 22)
+    assert ParashaDatabase(False).lookup(simchat_torah) == Parasha.VEZOT_HABRACHA